@@ -1,30 +1,57 @@
 import streamlit as st
 import pandas as pd
-from groq import Groq
-import plotly.express as px
+import numpy as np
 import requests
-import feedparser
-from bs4 import BeautifulSoup
 import time
-from streamlit_lottie import st_lottie
-from google import genai  # Modern way to import
-from PIL import Image
 import os
 import re
-from youtube_transcript_api import YouTubeTranscriptApi
 import io
-import yt_dlp
-import tempfile
+import shutil
+import importlib
+import sys
+import threading
+import hashlib
+import json
+import sqlite3
+import contextvars
+from collections import deque, namedtuple
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from datetime import datetime as dt
 import random
-import time
-from streamlit_lottie import st_lottie # You'll need: pip install streamlit-lottie
-import requests
-from streamlit_gsheets import GSheetsConnection
 import base64
-from io import BytesIO
 import urllib.parse
 
+# --- ⚡ LAZY DEPENDENCY LAYER ---
+# Heavy SDKs are only imported the first time a page actually touches them,
+# so the login gate and light pages never pay for yt_dlp / plotly / bs4 etc.
+LAZY_IMPORT_LOG = {}
+
+class LazyModule:
+    """Stand-in for a module that imports itself on first attribute access."""
+
+    def __init__(self, name):
+        self._name = name
+
+    def _load(self):
+        module = sys.modules.get(self._name)
+        if module is None:
+            # import_module holds the per-module import lock, so this is thread-safe
+            started = time.perf_counter()
+            module = importlib.import_module(self._name)
+            LAZY_IMPORT_LOG[self._name] = round((time.perf_counter() - started) * 1000, 1)
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+def lazy_import(name):
+    return LazyModule(name)
+
+# Page-scoped dependencies (only resolved when their page runs)
+yt_dlp = lazy_import("yt_dlp")  # Media Uplink + Growth Hub sync
+bs4 = lazy_import("bs4")  # Intel image scraping
+youtube_transcript_api = lazy_import("youtube_transcript_api")  # DNA extraction
+
 # 1. ABSOLUTE FIRST LINE
 st.set_page_config(page_title="VOID OS", layout="wide", initial_sidebar_state="expanded")
 
@@ -53,26 +80,14 @@ def initiate_teleport(target_page):
     # This syncs the radio widget state to prevent the "Ghost" error
     st.session_state.nav_radio = target_page
 
-# This defines 'conn' so the rest of the app can see it
-conn = st.connection("gsheets", type=GSheetsConnection)
-
 # --- INITIALIZE STATE (Place this near the top of your script) ---
 if "current_page" not in st.session_state:
     st.session_state.current_page = "🏠 Dashboard"
 
 # --- 🛰️ SECURE AI UPLINK ---
-# 1. INITIALIZE GLOBAL CLIENTS (ONCE)
-if "GROQ_API_KEY" in st.secrets:
-    raw_key = st.secrets["GROQ_API_KEY"].strip()
-else:
-    raw_key = None
-
-# 2. Initialize the ENGINE (This was the missing step)
-# This turns the 'str' into a 'Groq' object that has the '.chat' attribute
-if raw_key:
-    groq_c = Groq(api_key=raw_key)
-else:
-    groq_c = None
+# Clients come from the shared registry (see get_llm_client); the global
+# groq_c engine is bound right after the gatekeeper so the login gate never
+# has to import the SDKs.
 
 
 # --- INITIALIZE ALL KEYS ---
@@ -114,8 +129,6 @@ def fetch_vault_data(sheet_name):
 # --- 1. SESSION STATE (CRITICAL INITIALIZATION) ---
 if 'found_leads' not in st.session_state:
     st.session_state.found_leads = pd.DataFrame()
-if 'script_history' not in st.session_state:
-    st.session_state.script_history = []
 if 'pitch_history' not in st.session_state:
     st.session_state.pitch_history = []
 if 'creator_db' not in st.session_state:
@@ -153,8 +166,8 @@ def get_void_secret(key, backup_link):
 # For Public safety, replace the backup links with "RESTRICTED" once verified
 MARKET_PULSE_URL = get_void_secret("MARKET_PULSE_URL", "RESTRICTED")
 
-# We add the time logic here so the URL always stays fresh
-USER_DB_URL = get_void_secret("USER_DB_URL", "RESTRICTED") + "&t=" + str(time.time())
+# Freshness is handled by the shared sheet cache (see SheetCache)
+USER_DB_URL = get_void_secret("USER_DB_URL", "RESTRICTED")
 
 FORM_POST_URL = get_void_secret("FORM_POST_URL", "RESTRICTED")
 VAULT_FORM_URL = get_void_secret("VAULT_FORM_URL", "RESTRICTED")
@@ -163,14 +176,1213 @@ VAULT_SHEET_CSV_URL = get_void_secret("VAULT_SHEET_URL", "RESTRICTED")
 FEEDBACK_API_URL = get_void_secret("FEEDBACK_API_URL", "RESTRICTED")
 NEW_URL = get_void_secret("NEW_URL", "RESTRICTED")
 NEWS_API_KEY = get_void_secret("NEWS_API_KEY", "RESTRICTED")
+
+# Local persistence root (snapshots, stores, caches). Mount a volume here to survive redeploys.
+VOID_DATA_DIR = get_void_secret("VOID_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".void_data"))
+
+# --- 🛰️ SHARED LLM CLIENT REGISTRY ---
+# One client per (provider, key) for the whole process. Each client owns a
+# keep-alive httpx pool, so reruns and new sessions reuse warm TLS connections.
+LLM_PROVIDERS = {
+    "groq": {"secret": "GROQ_API_KEY", "module": "groq", "factory": "Groq"},
+    "openai": {"secret": "OPENAI_API_KEY", "module": "openai", "factory": "OpenAI"},
+}
+
+class LLMClientRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients = {}
+        self._stats = {name: {"hits": 0, "misses": 0, "requests": 0} for name in LLM_PROVIDERS}
+
+    def _build(self, provider, api_key):
+        import httpx
+        spec = LLM_PROVIDERS[provider]
+        stats = self._stats[provider]
+
+        def count_request(request):
+            stats["requests"] += 1
+
+        http_client = httpx.Client(
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=300),
+            timeout=httpx.Timeout(120.0, connect=10.0),
+            event_hooks={"request": [count_request]},
+        )
+        sdk = importlib.import_module(spec["module"])
+        # No SDK-level retries: a 429/5xx must reach the router at once so it can fail over
+        return getattr(sdk, spec["factory"])(api_key=api_key, http_client=http_client, max_retries=0)
+
+    def get(self, provider, api_key):
+        slot = (provider, hashlib.sha256(api_key.encode()).hexdigest())
+        with self._lock:
+            client = self._clients.get(slot)
+            if client is not None:
+                self._stats[provider]["hits"] += 1
+                return client
+            self._stats[provider]["misses"] += 1
+            client = self._build(provider, api_key)
+            self._clients[slot] = client
+            return client
+
+    def stats(self):
+        with self._lock:
+            return {name: dict(counts) for name, counts in self._stats.items()}
+
+@st.cache_resource
+def get_llm_registry():
+    return LLMClientRegistry()
+
+def get_llm_client(provider="groq"):
+    """Shared, pooled client for a provider, or None when its key is not configured."""
+    api_key = str(get_void_secret(LLM_PROVIDERS[provider]["secret"], "RESTRICTED")).strip()
+    if not api_key or api_key == "RESTRICTED":
+        return None
+    return get_llm_registry().get(provider, api_key)
+
+# --- 🪢 SINGLE-FLIGHT (IN-FLIGHT REQUEST DE-DUPLICATION) ---
+# Process-wide, so it spans reruns and sessions: while a request is running,
+# identical callers attach to it and receive its result instead of firing a
+# duplicate. Streaming flights also publish their partial text for followers.
+# Followers give up after SINGLE_FLIGHT_WAIT_SECONDS without progress.
+SINGLE_FLIGHT_WAIT_SECONDS = 180
+
+class Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.partial = ""
+        self.result = None
+        self.error = None
+
+    def wait(self, timeout=None):
+        if not self.done.wait(timeout):
+            raise TimeoutError("in-flight request did not finish in time")
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self._stats = {"leaders": 0, "joined": 0}
+
+    def join(self, key):
+        """(flight, is_leader). The leader must call finish(); everyone else waits on the flight."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self._stats["joined"] += 1
+                return flight, False
+            flight = self._flights[key] = Flight()
+            self._stats["leaders"] += 1
+            return flight, True
+
+    def finish(self, key, flight, result=None, error=None):
+        flight.result, flight.error = result, error
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        flight.done.set()
+
+    def do(self, key, fn, *args, **kwargs):
+        flight, leader = self.join(key)
+        if not leader:
+            return flight.wait(SINGLE_FLIGHT_WAIT_SECONDS)
+        result, error = None, None
+        try:
+            result = fn(*args, **kwargs)
+            return result
+        except Exception as e:
+            error = e
+            raise
+        except BaseException:
+            # e.g. Streamlit's stop/rerun on the leader's script thread: release
+            # followers with a plain error instead of re-raising it in their threads
+            error = RuntimeError("in-flight request was interrupted")
+            raise
+        finally:
+            self.finish(key, flight, result=result, error=error)
+
+    def stats(self):
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._flights)}
+
+@st.cache_resource
+def get_single_flight():
+    return SingleFlight()
+
+# --- 🚦 PROVIDER RATE LIMITER (TOKEN BUCKETS, FAIR QUEUE) ---
+# Provider quotas are per API key, so the buckets are process-wide. Each
+# provider (or provider/model override) has a requests-per-minute bucket and,
+# where it applies, a tokens-per-minute bucket. Waiters are served paid tiers
+# first, then whoever has had the fewest grants in the last minute, then FIFO.
+RATE_LIMITS = {
+    "groq": {"rpm": 30, "tpm": 12000},
+    "groq/llama-3.1-8b-instant": {"rpm": 30, "tpm": 20000},
+    "openai": {"rpm": 500, "tpm": 200000},
+    "openai/gpt-4o": {"rpm": 500, "tpm": 30000},
+    "elevenlabs": {"rpm": 60, "tpm": 40000},  # tpm counts characters
+}
+RATE_LIMIT_MAX_WAIT = 30
+RATE_FAIR_WINDOW = 60
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor whose tasks run in a copy of the submitter's contextvars."""
+
+    def submit(self, fn, *args, **kwargs):
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+class RateLimitTimeout(Exception):
+    pass
+
+class TokenBucket:
+    def __init__(self, per_minute):
+        self.capacity = float(per_minute)
+        self.level = self.capacity
+        self.rate = self.capacity / 60
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_for(self, amount):
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+class ProviderRateLimiter:
+    def __init__(self):
+        import itertools
+        self._cond = threading.Condition()
+        self._buckets = {}
+        self._waiting = {}
+        self._grants = {}
+        self._seq = itertools.count()
+        self._stats = {"granted": 0, "timeouts": 0, "waited_seconds": 0.0}
+        # Who the current call is made for: (owner, priority). Bound once per run
+        # after the gate and carried into pool threads by ContextThreadPoolExecutor.
+        # It lives on the cached limiter because every rerun re-executes app.py in a
+        # fresh namespace, so a module-level ContextVar would be a new one each run.
+        self.identity = contextvars.ContextVar("rate_identity", default=("anonymous", 1))
+
+    def _recent_grants(self, owner, now):
+        grants = self._grants.get(owner)
+        while grants and now - grants[0] > RATE_FAIR_WINDOW:
+            grants.popleft()
+        return len(grants) if grants else 0
+
+    def acquire(self, provider, model=None, cost=0, timeout=RATE_LIMIT_MAX_WAIT):
+        """Blocks until the call fits its buckets; returns seconds waited. Raises RateLimitTimeout."""
+        key = f"{provider}/{model}" if f"{provider}/{model}" in RATE_LIMITS else provider
+        limits = RATE_LIMITS.get(key)
+        if not limits:
+            return 0.0
+        owner, priority = self.identity.get()
+        ticket = (priority, next(self._seq), owner)
+        started = time.monotonic()
+        with self._cond:
+            requests_bucket, tokens_bucket = self._buckets.setdefault(
+                key, (TokenBucket(limits["rpm"]), TokenBucket(limits["tpm"]) if limits.get("tpm") else None)
+            )
+            cost = min(cost, tokens_bucket.capacity) if tokens_bucket else 0
+            queue = self._waiting.setdefault(key, [])
+            queue.append(ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    requests_bucket.refill(now)
+                    if tokens_bucket:
+                        tokens_bucket.refill(now)
+                    head = min(queue, key=lambda t: (t[0], self._recent_grants(t[2], now), t[1]))
+                    wait = 0.25
+                    if head is ticket:
+                        wait = max(requests_bucket.wait_for(1), tokens_bucket.wait_for(cost) if tokens_bucket else 0.0)
+                        if wait <= 0:
+                            requests_bucket.level -= 1
+                            if tokens_bucket:
+                                tokens_bucket.level -= cost
+                            self._grants.setdefault(owner, deque()).append(now)
+                            self._stats["granted"] += 1
+                            self._stats["waited_seconds"] += now - started
+                            return now - started
+                    remaining = started + timeout - now
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise RateLimitTimeout(f"{key} quota queue wait exceeded {timeout}s")
+                    self._cond.wait(min(wait, remaining, 1.0))
+            finally:
+                queue.remove(ticket)
+                self._cond.notify_all()
+
+    def depth(self):
+        with self._cond:
+            return {key: len(queue) for key, queue in self._waiting.items() if queue}
+
+    def stats(self):
+        with self._cond:
+            return dict(self._stats)
+
+@st.cache_resource
+def get_rate_limiter():
+    return ProviderRateLimiter()
+
+def estimate_request_tokens(messages, max_tokens=None):
+    """Rough prompt + completion size used to charge the tokens bucket up front."""
+    prompt_chars = sum(len(str(m.get("content", ""))) for m in messages)
+    return prompt_chars // 4 + (max_tokens or 1024)
+
+# --- 🧊 LLM RESPONSE CACHE (LRU + TTL, DISK-BACKED) ---
+# Completions are keyed by model, whitespace-normalized messages and sampling
+# parameters. Hot entries live in an in-memory LRU; every entry is written
+# through to SQLite so a restart comes back warm. Pass cache=False to opt out.
+LLM_CACHE_PATH = os.path.join(VOID_DATA_DIR, "llm_cache.sqlite3")
+LLM_CACHE_TTL = int(get_void_secret("LLM_CACHE_TTL", 6 * 3600))
+LLM_CACHE_MAX_ENTRIES = 512
+
+class LLMResponseCache:
+    def __init__(self, path, max_entries, ttl):
+        from collections import OrderedDict
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries = OrderedDict()  # key -> (stored_at, text, latency)
+        self._stats = {"hits": 0, "misses": 0, "saved_seconds": 0.0}
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS completions (
+                key TEXT PRIMARY KEY,
+                stored_at REAL NOT NULL,
+                latency REAL NOT NULL,
+                text TEXT NOT NULL
+            )
+        """)
+        self._warm()
+
+    def _warm(self):
+        cutoff = time.time() - self._ttl
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM completions WHERE stored_at < ?", (cutoff,))
+            rows = self._db.execute(
+                "SELECT key, stored_at, latency, text FROM completions ORDER BY stored_at DESC LIMIT ?",
+                (self._max_entries,),
+            ).fetchall()
+        for key, stored_at, latency, text in reversed(rows):
+            self._entries[key] = (stored_at, text, latency)
+
+    @staticmethod
+    def key(model, messages, params):
+        normalized = [
+            {"role": m.get("role"), "content": " ".join(str(m.get("content", "")).split())}
+            for m in messages
+        ]
+        blob = json.dumps({"model": model, "messages": normalized, "params": params}, sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.time() - entry[0] > self._ttl:
+                if entry is not None:
+                    del self._entries[key]
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            self._stats["saved_seconds"] += entry[2]
+            return entry[1]
+
+    def put(self, key, text, latency):
+        now = time.time()
+        with self._lock:
+            self._entries[key] = (now, text, latency)
+            self._entries.move_to_end(key)
+            evicted = []
+            while len(self._entries) > self._max_entries:
+                evicted.append(self._entries.popitem(last=False)[0])
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO completions (key, stored_at, latency, text) VALUES (?, ?, ?, ?)",
+                    (key, now, latency, text),
+                )
+                self._db.executemany("DELETE FROM completions WHERE key = ?", [(k,) for k in evicted])
+
+    def clear(self):
+        with self._lock, self._db:
+            self._entries.clear()
+            self._db.execute("DELETE FROM completions")
+
+    def stats(self):
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "hit_ratio": self._stats["hits"] / lookups if lookups else 0.0,
+            }
+
+@st.cache_resource
+def get_llm_cache():
+    return LLMResponseCache(LLM_CACHE_PATH, LLM_CACHE_MAX_ENTRIES, LLM_CACHE_TTL)
+
+# --- 🧭 MODEL ROUTER (TASK -> ORDERED MODELS, ROLLING HEALTH) ---
+# Call sites name a task, not a model. Each task maps to an ordered list of
+# (provider, model) candidates; 429/5xx/connection failures fail over to the
+# next one and put the throttled model on a short cooldown. "fast" tasks are
+# sent to whichever qualifying model currently has the lowest rolling p50.
+MODEL_ROUTES = {
+    "strategy": {"fast": False, "models": [("groq", "llama-3.3-70b-versatile"), ("openai", "gpt-4o-mini"), ("groq", "llama-3.1-8b-instant")]},
+    "longform": {"fast": False, "models": [("groq", "llama-3.3-70b-versatile"), ("openai", "gpt-4o")]},
+    "script": {"fast": False, "models": [("groq", "llama-3.1-8b-instant"), ("groq", "llama-3.3-70b-versatile"), ("openai", "gpt-4o-mini")]},
+    "dialectic": {"fast": False, "models": [("openai", "gpt-4o"), ("groq", "llama-3.3-70b-versatile")]},
+    "chat": {"fast": False, "models": [("groq", "llama-3.3-70b-versatile"), ("openai", "gpt-4o-mini")]},
+    "classify": {"fast": True, "models": [("groq", "llama-3.1-8b-instant"), ("openai", "gpt-4o-mini"), ("groq", "llama-3.3-70b-versatile")]},
+    "condense": {"fast": True, "models": [("groq", "llama-3.1-8b-instant"), ("openai", "gpt-4o-mini")]},
+}
+ROUTER_WINDOW = 50
+ROUTER_COOLDOWN_SECONDS = 20
+ROUTER_FAILOVER_STATUS = {429, 500, 502, 503, 504}
+
+class ModelRouter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples = {}  # model -> deque[(latency, ok)]
+        self._cooldown_until = {}
+
+    @staticmethod
+    def is_failover_error(exc):
+        status = getattr(exc, "status_code", None)
+        if status in ROUTER_FAILOVER_STATUS:
+            return True
+        return any(tag in type(exc).__name__ for tag in ("Connection", "Timeout"))
+
+    def _health(self, model):
+        samples = self._samples.get(model) or ()
+        latencies = sorted(lat for lat, ok in samples if ok)
+        errors = sum(1 for _, ok in samples if not ok)
+        return {
+            "p50": latencies[len(latencies) // 2] if latencies else None,
+            "error_rate": errors / len(samples) if samples else 0.0,
+            "calls": len(samples),
+        }
+
+    def candidates(self, task):
+        """(provider, model, client) triples in the order they should be tried."""
+        route = MODEL_ROUTES[task]
+        now = time.time()
+        with self._lock:
+            health = {model: self._health(model) for _, model in route["models"]}
+            cooling = {model for _, model in route["models"] if self._cooldown_until.get(model, 0) > now}
+
+        def rank(item):
+            position, (_, model) = item
+            h = health[model]
+            degraded = model in cooling or h["error_rate"] > 0.5
+            if route["fast"] and h["p50"] is not None:
+                return (degraded, 0, h["p50"], position)
+            return (degraded, 1 if route["fast"] else 0, 0.0, position)
+
+        ordered = []
+        for _, (provider, model) in sorted(enumerate(route["models"]), key=rank):
+            client = get_llm_client(provider)
+            if client is not None:
+                ordered.append((provider, model, client))
+        if not ordered:
+            raise RuntimeError(f"No configured provider for task '{task}'")
+        return ordered
+
+    @staticmethod
+    def is_primary(task, model):
+        """Whether `model` is the answer the route is meant to give, as opposed to a failover.
+
+        Any qualifying model serves a "fast" task by design; otherwise only the first
+        candidate with a configured provider counts.
+        """
+        route = MODEL_ROUTES[task]
+        if route["fast"]:
+            return True
+        primary = next((m for provider, m in route["models"] if get_llm_client(provider) is not None), None)
+        return model == primary
+
+    def record(self, model, latency, ok, exc=None):
+        from collections import deque
+        with self._lock:
+            self._samples.setdefault(model, deque(maxlen=ROUTER_WINDOW)).append((latency, ok))
+            if exc is not None and getattr(exc, "status_code", None) == 429:
+                self._cooldown_until[model] = time.time() + ROUTER_COOLDOWN_SECONDS
+
+    def stats(self):
+        with self._lock:
+            now = time.time()
+            return {
+                model: {**self._health(model), "cooling": self._cooldown_until.get(model, 0) > now}
+                for model in self._samples
+            }
+
+@st.cache_resource
+def get_model_router():
+    return ModelRouter()
+
+def _routed_create(task, messages, **params):
+    """Opens a completion on the first healthy candidate; returns (model, response, started)."""
+    router = get_model_router()
+    last_error = None
+    cost = estimate_request_tokens(messages, params.get("max_tokens"))
+    for provider, model, client in router.candidates(task):
+        try:
+            # A model whose quota queue is too long times out here and fails over like a 429
+            get_rate_limiter().acquire(provider, model, cost)
+        except RateLimitTimeout as e:
+            last_error = e
+            continue
+        started = time.perf_counter()
+        try:
+            return model, client.chat.completions.create(model=model, messages=messages, **params), started
+        except Exception as e:
+            router.record(model, time.perf_counter() - started, False, e)
+            if not router.is_failover_error(e):
+                raise
+            last_error = e
+    raise last_error
+
+def llm_complete(task, messages, cache=True, **params):
+    """Text of a routed chat completion, served from the shared response cache unless cache=False.
+
+    Identical requests already in flight are joined rather than repeated, cached or not.
+    """
+    response_cache = get_llm_cache()
+    key = response_cache.key(task, messages, params)
+    if cache:
+        text = response_cache.get(key)
+        if text is not None:
+            return text
+
+    def complete():
+        model, res, started = _routed_create(task, messages, **params)
+        latency = time.perf_counter() - started
+        get_model_router().record(model, latency, True)
+        text = res.choices[0].message.content
+        # The cache is keyed by task, so a failover answer would keep being served
+        # for LLM_CACHE_TTL after the primary model recovers
+        if cache and text and ModelRouter.is_primary(task, model):
+            response_cache.put(key, text, latency)
+        return text
+
+    return get_single_flight().do(("llm", key), complete)
+
+LLM_STREAM_REFRESH_SECONDS = 0.05
+
+def llm_stream(task, messages, placeholder=None, render="markdown", cache=True, **params):
+    """Streams a routed chat completion into `placeholder` token by token and returns the full text.
+
+    `render` names the element method used to paint the text (markdown, info, warning...).
+    Cached responses are painted in one go; cache=False always streams a fresh completion.
+    Failover happens before the first token; a stream that breaks midway raises.
+    """
+    placeholder = placeholder if placeholder is not None else st.empty()
+    return llm_stream_many({"text": (task, messages, placeholder, render, params)}, cache=cache)["text"]
+
+def llm_stream_many(streams, cache=True):
+    """Streams several routed completions side by side; returns {name: text}.
+
+    `streams` maps name -> (task, messages, placeholder, render, params). Each entry
+    is an ordinary llm_stream flight; all of them are painted from one loop.
+    """
+    response_cache = get_llm_cache()
+    flights = get_single_flight()
+    results, pending = {}, {}
+    for name, (task, messages, placeholder, render, params) in streams.items():
+        paint = getattr(placeholder, render)
+        key = response_cache.key(task, messages, params)
+        text = response_cache.get(key) if cache else None
+        if text is not None:
+            paint(text)
+            results[name] = text
+            continue
+        # The completion is pumped on a worker thread so a rerun (double click, new
+        # session) can attach to the same flight instead of opening a second one.
+        flight, leader = flights.join(("llm", key))
+        if leader:
+            get_fanout_executor().submit(_pump_stream, flights, flight, key, task, messages, cache, params)
+        pending[name] = (flight, paint)
+
+    # A flight that makes no progress for SINGLE_FLIGHT_WAIT_SECONDS is abandoned
+    progress = {name: ("", time.monotonic()) for name in pending}
+    while pending:
+        time.sleep(LLM_STREAM_REFRESH_SECONDS)
+        for name, (flight, paint) in list(pending.items()):
+            if flight.done.is_set():
+                del pending[name]
+                results[name] = flight.wait()
+                paint(results[name])
+                continue
+            partial, moved_at = progress[name]
+            if flight.partial != partial:
+                progress[name] = (flight.partial, time.monotonic())
+                paint(flight.partial + "▌")
+            elif time.monotonic() - moved_at > SINGLE_FLIGHT_WAIT_SECONDS:
+                raise TimeoutError("in-flight stream stalled")
+    return results
+
+def stream_completion(task, messages, on_partial, **params):
+    """Reads a routed streaming completion, passing the text so far to on_partial; returns (text, latency, model)."""
+    model, stream, started = _routed_create(task, messages, stream=True, **params)
+    parts = []
+    try:
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                parts.append(delta)
+                on_partial("".join(parts))
+    except Exception as e:
+        get_model_router().record(model, time.perf_counter() - started, False, e)
+        raise
+    latency = time.perf_counter() - started
+    get_model_router().record(model, latency, True)
+    return "".join(parts), latency, model
+
+def _pump_stream(flights, flight, key, task, messages, cache, params):
+    """Leader side of a streaming flight: reads the stream into flight.partial."""
+    try:
+        text, latency, model = stream_completion(task, messages, lambda partial: setattr(flight, "partial", partial), **params)
+        if cache and text and ModelRouter.is_primary(task, model):
+            get_llm_cache().put(key, text, latency)
+    except Exception as e:
+        flights.finish(("llm", key), flight, error=e)
+        return
+    flights.finish(("llm", key), flight, result=text)
+
+# --- 🧬 DOCUMENT INGESTION (CHUNK -> MAP -> REDUCE) ---
+# Long sources are split into token-budgeted chunks, condensed concurrently,
+# then reduced (tree-wise if needed) into a result that fits the prompt budget.
+# The final reduction is cached by a hash of the source contents.
+tiktoken = lazy_import("tiktoken")
+
+INGEST_CHUNK_TOKENS = 1500
+INGEST_MAP_TOKENS = 350
+INGEST_REDUCE_INPUT_TOKENS = 6000
+INGEST_PROFILE_TOKENS = 900
+
+@st.cache_resource
+def get_token_encoder():
+    """cl100k encoder when tiktoken is installed, else None (≈4 chars per token)."""
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+def count_tokens(text):
+    encoder = get_token_encoder()
+    if encoder is None:
+        return (len(text) + 3) // 4
+    return len(encoder.encode(text, disallowed_special=()))
+
+def _split_by_tokens(text, max_tokens):
+    encoder = get_token_encoder()
+    if encoder is None:
+        step = max_tokens * 4
+        return [text[i:i + step] for i in range(0, len(text), step)]
+    tokens = encoder.encode(text, disallowed_special=())
+    return [encoder.decode(tokens[i:i + max_tokens]) for i in range(0, len(tokens), max_tokens)]
+
+def chunk_text(text, max_tokens=INGEST_CHUNK_TOKENS):
+    """Packs paragraphs into chunks of at most max_tokens; oversized paragraphs are hard-split."""
+    chunks, current, current_tokens = [], [], 0
+    for para in re.split(r"\n\s*\n", text):
+        para = para.strip()
+        if not para:
+            continue
+        n = count_tokens(para)
+        if current and current_tokens + n > max_tokens:
+            chunks.append("\n\n".join(current))
+            current, current_tokens = [], 0
+        if n > max_tokens:
+            chunks.extend(_split_by_tokens(para, max_tokens))
+            continue
+        current.append(para)
+        current_tokens += n
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+def _pack_notes(notes, max_tokens):
+    """Groups notes into batches whose combined size stays under max_tokens."""
+    batches, current, current_tokens = [], [], 0
+    for note in notes:
+        n = count_tokens(note)
+        if current and current_tokens + n > max_tokens:
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(note)
+        current_tokens += n
+    if current:
+        batches.append(current)
+    return batches
+
+def summarize_documents(documents, instruction, task="strategy", map_task="condense",
+                        budget_tokens=INGEST_PROFILE_TOKENS, progress=None):
+    """Condenses [(name, text), ...] into one result of about budget_tokens.
+
+    Sources that already fit the reduce window go straight to a single reduce call.
+    `progress(done, total)` is called from the caller's thread as map chunks finish.
+    """
+    from concurrent.futures import as_completed
+    documents = [(name, text) for name, text in documents if text and text.strip()]
+    if not documents:
+        return ""
+
+    content_hash = hashlib.sha256()
+    for name, text in documents:
+        content_hash.update(name.encode() + b"\0" + text.encode() + b"\0")
+    response_cache = get_llm_cache()
+    reduce_key = response_cache.key(
+        task, [{"role": "system", "content": instruction}],
+        {"ingest": content_hash.hexdigest(), "map_task": map_task, "budget": budget_tokens},
+    )
+    cached = response_cache.get(reduce_key)
+    if cached is not None:
+        return cached
+    started = time.perf_counter()
+
+    notes = [f"--- SOURCE: {name} ---\n{text.strip()}" for name, text in documents]
+    if sum(count_tokens(n) for n in notes) > INGEST_REDUCE_INPUT_TOKENS:
+        jobs = [
+            (name, i, len(parts), part)
+            for name, text in documents
+            for parts in [chunk_text(text)]
+            for i, part in enumerate(parts, 1)
+        ]
+        map_system = (
+            f"You are condensing source material. Goal: {instruction} "
+            f"Extract only what serves that goal as dense bullet notes. Keep names, numbers and signature phrasing."
+        )
+        futures = {
+            get_llm_bulk_executor().submit(
+                llm_complete, map_task,
+                [{"role": "system", "content": map_system},
+                 {"role": "user", "content": f"SOURCE: {name} (part {i}/{total})\n\n{part}"}],
+                temperature=0.1, max_tokens=INGEST_MAP_TOKENS,
+            ): idx
+            for idx, (name, i, total, part) in enumerate(jobs)
+        }
+        mapped = [None] * len(jobs)
+        for done, future in enumerate(as_completed(futures), 1):
+            name, i, total, _ = jobs[futures[future]]
+            mapped[futures[future]] = f"--- SOURCE: {name} (part {i}/{total}) ---\n{future.result()}"
+            if progress:
+                progress(done, len(jobs))
+        notes = mapped
+
+    reduce_system = (
+        f"{instruction} Merge the notes below into a single result of at most {budget_tokens} tokens. "
+        f"Deduplicate, keep the strongest specifics, drop filler."
+    )
+    while True:
+        batches = _pack_notes(notes, INGEST_REDUCE_INPUT_TOKENS)
+        futures = [
+            get_llm_bulk_executor().submit(
+                llm_complete, task,
+                [{"role": "system", "content": reduce_system}, {"role": "user", "content": "\n\n".join(batch)}],
+                temperature=0.1, max_tokens=budget_tokens,
+            )
+            for batch in batches
+        ]
+        reduced = [future.result() for future in futures]
+        if len(reduced) == 1:
+            result = reduced[0]
+            break
+        notes = reduced
+
+    response_cache.put(reduce_key, result, time.perf_counter() - started)
+    return result
+
+# --- 🧠 ROLLING CHAT MEMORY (VOID MANAGER) ---
+# The last few messages go to the model verbatim (each clipped to a token cap);
+# anything older is folded into a running summary, updated incrementally in the
+# background, so the prompt stays roughly the same size however long the chat runs.
+CHAT_MEMORY_MESSAGES = 6
+CHAT_MESSAGE_TOKENS = 600
+CHAT_SUMMARY_TOKENS = 300
+
+def fold_chat_memory(summary, turns, folded_upto):
+    """(updated summary, folded_upto) after merging `turns` into the running summary."""
+    transcript = "\n".join(f"{m['role'].upper()}: {m['content']}" for m in turns)
+    updated = llm_complete(
+        "condense",
+        [{"role": "system", "content": f"You maintain the running memory of a strategy chat. Update the summary with the new turns. "
+                                       f"Keep decisions, facts about the user, open questions and key figures. At most {CHAT_SUMMARY_TOKENS} tokens."},
+         {"role": "user", "content": f"CURRENT SUMMARY:\n{summary or '(empty)'}\n\nNEW TURNS:\n{transcript}"}],
+        cache=False,  # Private turns never repeat; keep them out of the shared disk cache
+        temperature=0.1, max_tokens=CHAT_SUMMARY_TOKENS,
+    )
+    return updated, folded_upto
+
+def build_chat_context(history, summary, folded):
+    """Summary of folded turns plus the verbatim tail of `history`, as chat messages."""
+    messages = []
+    if summary:
+        messages.append({"role": "system", "content": f"[CONVERSATION MEMORY]: {summary}"})
+    for msg in history[max(folded, len(history) - CHAT_MEMORY_MESSAGES):]:
+        content = msg["content"]
+        if count_tokens(content) > CHAT_MESSAGE_TOKENS:
+            content = _split_by_tokens(content, CHAT_MESSAGE_TOKENS)[0] + " …[clipped]"
+        messages.append({"role": msg["role"], "content": content})
+    return messages
+
+# --- 🔎 VAULT RETRIEVAL (LOCAL BM25) ---
+# Identity Vault sources are cut into small chunks and kept per user in the
+# local store. A sparse BM25 index (per-term postings over NumPy arrays, CPU
+# only, no embedding service) is built once per corpus and returns the top-k chunks
+# for a Forge topic.
+VAULT_CHUNK_TOKENS = 220
+VAULT_TOP_K = 4
+BM25_K1 = 1.5
+BM25_B = 0.75
+RETRIEVAL_STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have how i in is it its of on or that the this to was we what when "
+    "which who why will with you your".split()
+)
+
+def retrieval_terms(text):
+    return [t for t in re.findall(r"[a-z0-9]+", text.lower()) if t not in RETRIEVAL_STOPWORDS and len(t) > 1]
+
+class BM25Index:
+    def __init__(self, chunks):
+        """chunks: list of (source name, text)."""
+        from collections import Counter
+        self.chunks = chunks
+        # Sparse postings: term -> (chunk rows, term frequencies); memory grows with
+        # the corpus size, not with chunks x vocabulary
+        postings = {}
+        doc_len = np.zeros(len(chunks), dtype=np.float32)
+        for row, (_, text) in enumerate(chunks):
+            counts = Counter(retrieval_terms(text))
+            doc_len[row] = sum(counts.values())
+            for term, count in counts.items():
+                postings.setdefault(term, ([], []))
+                postings[term][0].append(row)
+                postings[term][1].append(count)
+        n = max(len(chunks), 1)
+        self.postings = {}
+        for term, (rows, counts) in postings.items():
+            idf = float(np.log1p((n - len(rows) + 0.5) / (len(rows) + 0.5)))
+            self.postings[term] = (idf, np.asarray(rows, dtype=np.int32), np.asarray(counts, dtype=np.float32))
+        avg_len = max(float(doc_len.mean()), 1.0) if len(chunks) else 1.0
+        self.norm = (BM25_K1 * (1 - BM25_B + BM25_B * doc_len / avg_len)).astype(np.float32)
+
+    def search(self, query, k=VAULT_TOP_K):
+        """Top-k (score, source name, text) for the query, best first; empty when nothing matches."""
+        terms = {t for t in retrieval_terms(query) if t in self.postings}
+        if not terms or not self.chunks:
+            return []
+        scores = np.zeros(len(self.chunks), dtype=np.float32)
+        for term in terms:
+            idf, rows, tf = self.postings[term]
+            scores[rows] += idf * tf * (BM25_K1 + 1) / (tf + self.norm[rows])
+        top = np.argsort(-scores)[:k]
+        return [(float(scores[i]), *self.chunks[i]) for i in top if scores[i] > 0]
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def get_vault_index(corpus_hash, _chunks):
+    return BM25Index(_chunks)
+
+def index_vault_sources(email, sources):
+    """Chunks [(name, text)] into the user's vault corpus; re-synced files replace their old chunks."""
+    store = get_void_store()
+    corpus = store.get_doc(email, "vault_chunks", {})
+    for name, text in sources:
+        corpus[name] = chunk_text(text, VAULT_CHUNK_TOKENS)
+    store.put_doc(email, "vault_chunks", corpus)
+    return sum(len(chunks) for chunks in corpus.values())
+
+def retrieve_vault_context(email, query, k=VAULT_TOP_K):
+    """Top-k vault chunks for `query` as [(score, source name, text)]."""
+    corpus = get_void_store().get_doc(email, "vault_chunks", {})
+    chunks = [(name, chunk) for name in sorted(corpus) for chunk in corpus[name]]
+    if not chunks or not query:
+        return []
+    corpus_hash = hashlib.sha256(json.dumps(chunks).encode()).hexdigest()
+    return get_vault_index(corpus_hash, chunks).search(query, k)
+
+# --- 🧪 FULL-LENGTH SCRIPT AUDIT ---
+# Every analysis runs over every chunk of the script at once; per-chunk findings
+# are merged per analysis. The combined report is cached by the script's hash.
+AUDIT_ANALYSES = {
+    "virality": "Critique the virality and CTR potential of this script on a scale of 1-100 and give 3 improvements.",
+    "retention": "Analyze the retention triggers and pattern interrupts in this script, and flag where viewers are likely to drop off.",
+}
+AUDIT_CHUNK_TOKENS = 1200
+
+def audit_script(script, placeholders):
+    """{analysis: report} for the whole script, cached by content hash.
+
+    `placeholders` maps each analysis to (placeholder, render); the final pass of
+    every analysis (the only pass for a one-chunk script, else the merge) streams
+    into its placeholder while the analyses run concurrently.
+    """
+    response_cache = get_llm_cache()
+    script_hash = hashlib.sha256(script.encode()).hexdigest()
+    report_key = response_cache.key("audit", [{"role": "system", "content": json.dumps(AUDIT_ANALYSES, sort_keys=True)}],
+                                    {"script": script_hash})
+    cached = response_cache.get(report_key)
+    if cached is not None:
+        report = json.loads(cached)
+        for name, (placeholder, render) in placeholders.items():
+            getattr(placeholder, render)(report[name])
+        return report
+    started = time.perf_counter()
+
+    chunks = chunk_text(script, AUDIT_CHUNK_TOKENS) or [script]
+    if len(chunks) == 1:
+        streams = {
+            name: ("classify",
+                   [{"role": "system", "content": instruction},
+                    {"role": "user", "content": f"SCRIPT SEGMENT 1/1:\n\n{chunks[0]}"}],
+                   *placeholders[name], {})
+            for name, instruction in AUDIT_ANALYSES.items()
+        }
+    else:
+        for placeholder, render in placeholders.values():
+            getattr(placeholder, render)(f"⏳ Auditing {len(chunks)} segments...")
+        bulk = get_llm_bulk_executor()
+        futures = {
+            (name, i): bulk.submit(
+                llm_complete, "classify",
+                [{"role": "system", "content": instruction},
+                 {"role": "user", "content": f"SCRIPT SEGMENT {i}/{len(chunks)}:\n\n{chunk}"}],
+            )
+            for name, instruction in AUDIT_ANALYSES.items()
+            for i, chunk in enumerate(chunks, 1)
+        }
+        findings = {name: [] for name in AUDIT_ANALYSES}
+        for (name, i), future in futures.items():
+            findings[name].append(f"--- SEGMENT {i}/{len(chunks)} ---\n{future.result()}")
+        streams = {
+            name: ("strategy",
+                   [{"role": "system", "content": f"{AUDIT_ANALYSES[name]} You are given findings for consecutive segments "
+                                                  f"of one script. Merge them into a single audit of the whole script: "
+                                                  f"one overall score where asked, the strongest issues with their segment, no repetition."},
+                    {"role": "user", "content": "\n\n".join(notes)}],
+                   *placeholders[name], {})
+            for name, notes in findings.items()
+        }
+    report = llm_stream_many(streams)
+
+    response_cache.put(report_key, json.dumps(report), time.perf_counter() - started)
+    return report
+
+# --- 🏭 BACKGROUND JOB QUEUE ---
+# Long generations run on a bounded worker pool instead of the script thread.
+# A job belongs to (owner, kind); pages submit it, poll it through a fragment,
+# and collect the result on whichever rerun or visit comes after it finishes.
+# Collected jobs are dropped at once; uncollected ones after JOB_RETENTION_SECONDS.
+# Job functions take the Job as their first argument and must not call st.*.
+JOB_WORKERS = 4
+JOB_RETENTION_SECONDS = 2 * 3600
+JOB_POLL_SECONDS = 1
+
+class Job:
+    def __init__(self, owner, kind, meta=None):
+        import uuid
+        self.id = uuid.uuid4().hex[:12]
+        self.owner = owner
+        self.kind = kind
+        self.meta = meta or {}
+        self.status = "queued"
+        self.progress = 0.0
+        self.message = "Queued"
+        self.partial = ""
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+
+    @property
+    def active(self):
+        return self.status in ("queued", "running")
+
+    def update(self, progress=None, message=None, partial=None):
+        if progress is not None:
+            self.progress = min(max(progress, 0.0), 1.0)
+        if message is not None:
+            self.message = message
+        if partial is not None:
+            self.partial = partial
+
+class JobQueue:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._pool = ContextThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="void-job")
+
+    def _run(self, job, fn, args, kwargs):
+        job.status, job.message = "running", "Running"
+        try:
+            job.result = fn(job, *args, **kwargs)
+            job.status, job.progress, job.message = "done", 1.0, "Complete"
+        except Exception as e:
+            job.error = e
+            job.status, job.message = "failed", str(e)
+        job.finished_at = time.time()
+
+    def submit(self, owner, kind, fn, *args, meta=None, **kwargs):
+        """Queues fn(job, *args, **kwargs); an active job of the same (owner, kind) is returned instead.
+
+        `meta` rides along with the job for whoever collects it (e.g. archive fields).
+        """
+        with self._lock:
+            now = time.time()
+            for job_id, job in list(self._jobs.items()):
+                if job.finished_at and now - job.finished_at > JOB_RETENTION_SECONDS:
+                    del self._jobs[job_id]
+            current = self._latest(owner, kind)
+            if current is not None and current.active:
+                return current
+            job = Job(owner, kind, meta)
+            self._jobs[job.id] = job
+        self._pool.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def get(self, job_id):
+        return self._jobs.get(job_id)
+
+    def release(self, job_id):
+        """Forgets a finished job once it has been collected, so its result can be freed."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and not job.active:
+                del self._jobs[job_id]
+
+    def _latest(self, owner, kind):
+        matches = [j for j in self._jobs.values() if j.owner == owner and j.kind == kind]
+        return max(matches, key=lambda j: j.created_at) if matches else None
+
+    def latest(self, owner, kind):
+        with self._lock:
+            return self._latest(owner, kind)
+
+    def stats(self):
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return {status: sum(1 for j in jobs if j.status == status) for status in ("queued", "running", "done", "failed")}
+
+@st.cache_resource
+def get_job_queue():
+    return JobQueue()
+
+def submit_job(kind, fn, *args, **kwargs):
+    return get_job_queue().submit(st.session_state.get('user_email', 'unknown'), kind, fn, *args, **kwargs)
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def job_monitor(job_id, label, render="markdown"):
+    """Progress view for an active job; hands control back to the full page once it finishes."""
+    job = get_job_queue().get(job_id)
+    if job is None or not job.active:
+        st.rerun()
+    st.progress(job.progress, text=f"{label} // {job.message}")
+    if job.partial:
+        getattr(st, render)(job.partial + "▌")
+
+def collect_job(kind, label, render="markdown"):
+    """This user's finished `kind` job, once per session; shows live progress while it is still running."""
+    job = get_job_queue().latest(st.session_state.get('user_email', 'unknown'), kind)
+    if job is None:
+        return None
+    if job.active:
+        job_monitor(job.id, label, render)
+        return None
+    collected = st.session_state.setdefault('collected_jobs', set())
+    if job.id in collected:
+        return None
+    collected.add(job.id)
+    # The caller moves the result into session state; the queue stops holding it
+    get_job_queue().release(job.id)
+    return job
+
+def stream_job(job, task, messages, expected_tokens, **params):
+    """Job body for a streamed completion; progress is estimated against expected_tokens."""
+    def report(partial):
+        job.update(progress=min(0.95, len(partial) / (4 * expected_tokens)), partial=partial)
+    job.update(message="Streaming")
+    return stream_completion(task, messages, report, **params)[0]
+
+def radio_script_job(job, sources, brief_instruction, fallback_context, build_prompt):
+    """Job body for VOID Radio: condense the uploads, then stream the two-host dialectic."""
+    context_data = fallback_context
+    if sources:
+        context_data = summarize_documents(
+            sources, brief_instruction, budget_tokens=1500,
+            progress=lambda done, total: job.update(progress=0.4 * done / total, message=f"Condensing sources {done}/{total}"),
+        )
+    job.update(progress=0.4, message="Scripting dialectic")
+
+    def report(partial):
+        job.update(progress=min(0.95, 0.4 + len(partial) / (4 * 4000)), partial=partial)
+
+    script, _, model = stream_completion(
+        "dialectic", # gpt-4o first: high reasoning for best dialectic
+        [{"role": "system", "content": "You are a world-class podcast producer and strategist."},
+         {"role": "user", "content": build_prompt(context_data)}],
+        report,
+        temperature=0.85,
+    )
+    job.meta["model"] = model  # Credits depend on which model actually served it
+    return script
+
+def image_job(job, client, prompt):
+    """Job body for a DALL-E 3 render; returns the image URL."""
+    job.update(progress=0.1, message="Rendering")
+    img_res = client.images.generate(model="dall-e-3", prompt=prompt, n=1, size="1024x1024")
+    return img_res.data[0].url
+
+def dual_voice_audio_job(job, script, voice_a, voice_b, api_key):
+    """Job body for the Radio master: one ElevenLabs call per host line, concatenated."""
+    segments = [s for s in re.split(r'(\[HOST [A|B]\]:)', script) if s.strip()]
+    lines, current_voice = [], voice_a
+    for segment in segments:
+        if "[HOST A]" in segment:
+            current_voice = voice_a
+        elif "[HOST B]" in segment:
+            current_voice = voice_b
+        else:
+            text = segment.replace(":", "").strip()
+            if len(text) > 2:
+                lines.append((current_voice, text))
+
+    combined_audio = b""
+    job.meta["voiced"] = (0, len(lines))
+    for i, (voice, text) in enumerate(lines, 1):
+        job.update(progress=(i - 1) / max(len(lines), 1), message=f"Voicing line {i}/{len(lines)}")
+        try:
+            get_rate_limiter().acquire("elevenlabs", cost=len(text), timeout=120)
+        except RateLimitTimeout:
+            # Quota ran dry midway: hand back the lines already voiced
+            if not combined_audio:
+                raise
+            break
+        res = requests.post(
+            f"https://api.elevenlabs.io/v1/text-to-speech/{voice}",
+            json={"text": text, "model_id": "eleven_multilingual_v2", "voice_settings": {"stability": 0.4, "similarity_boost": 0.8}},
+            headers={"xi-api-key": api_key, "Content-Type": "application/json"},
+            timeout=60,
+        )
+        if res.status_code == 200:
+            combined_audio += res.content
+        job.meta["voiced"] = (i, len(lines))
+    return combined_audio
+
+def forge_audio_job(job, voice_id, text, api_key):
+    """Job body for the Neural Forge voiceover: one ElevenLabs call for the whole script."""
+    job.update(progress=0.1, message="Waiting for voice quota")
+    get_rate_limiter().acquire("elevenlabs", cost=len(text), timeout=120)
+    job.update(progress=0.3, message="Synthesizing voiceover")
+    res = requests.post(
+        f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}",
+        json={"text": text, "model_id": "eleven_multilingual_v2", "voice_settings": {"stability": 0.5, "similarity_boost": 0.8}},
+        headers={"xi-api-key": api_key, "Content-Type": "application/json"},
+        timeout=120,
+    )
+    if res.status_code != 200:
+        raise RuntimeError(res.text)
+    return res.content
+
+# --- 📡 WEBHOOK TRANSPORT (APPS SCRIPT / FORMS) ---
+# Every Apps Script / form POST goes through one pooled session per host with
+# bounded timeouts and jittered retries. Only failures where the request never
+# reached the script (connect timeout, refused connection, 429/503) are retried;
+# a 502/504 or a dropped response may mean it already ran, so OTP and
+# registration calls are never executed twice.
+WEBHOOK_MAX_TIMEOUT = 30
+WEBHOOK_ATTEMPTS = 3
+WEBHOOK_RETRY_STATUS = {429, 503}
+
+def _request_never_sent(exc):
+    """True when a ConnectionError happened while connecting, before any bytes were sent."""
+    from urllib3.exceptions import NewConnectionError  # refused / DNS failure
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(reason, NewConnectionError)
+
+class WebhookTransport:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._stats = {}
+
+    def _session(self, url):
+        host = urllib.parse.urlparse(url).netloc
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def _record(self, endpoint, elapsed_ms, ok, retries):
+        from collections import deque
+        with self._lock:
+            entry = self._stats.setdefault(endpoint, {"calls": 0, "errors": 0, "retries": 0, "latency_ms": deque(maxlen=200)})
+            entry["calls"] += 1
+            entry["retries"] += retries
+            entry["errors"] += 0 if ok else 1
+            entry["latency_ms"].append(elapsed_ms)
+
+    def post(self, url, endpoint, timeout=15, **kwargs):
+        session = self._session(url)
+        read_timeout = min(float(timeout or WEBHOOK_MAX_TIMEOUT), WEBHOOK_MAX_TIMEOUT)
+        started = time.perf_counter()
+        for attempt in range(WEBHOOK_ATTEMPTS):
+            last_try = attempt == WEBHOOK_ATTEMPTS - 1
+            try:
+                response = session.post(url, timeout=(5, read_timeout), **kwargs)
+            except requests.exceptions.ConnectionError as e:
+                # RemoteDisconnected etc. come after the request went out: never replay
+                if last_try or not _request_never_sent(e):
+                    self._record(endpoint, (time.perf_counter() - started) * 1000, False, attempt)
+                    raise
+            except requests.exceptions.RequestException:
+                # Read timeouts etc. may have already executed the script: never replay
+                self._record(endpoint, (time.perf_counter() - started) * 1000, False, attempt)
+                raise
+            else:
+                if response.status_code not in WEBHOOK_RETRY_STATUS or last_try:
+                    self._record(endpoint, (time.perf_counter() - started) * 1000, response.ok, attempt)
+                    return response
+            # Full-jitter exponential backoff: 0-0.5s, 0-1s, ...
+            time.sleep(random.uniform(0, 0.5 * (2 ** attempt)))
+
+    def stats(self):
+        with self._lock:
+            report = {}
+            for endpoint, entry in self._stats.items():
+                samples = sorted(entry["latency_ms"])
+                report[endpoint] = {
+                    "calls": entry["calls"],
+                    "errors": entry["errors"],
+                    "retries": entry["retries"],
+                    "p50_ms": round(samples[len(samples) // 2]) if samples else 0,
+                    "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))]) if samples else 0,
+                }
+            return report
+
+@st.cache_resource
+def get_webhook_transport():
+    return WebhookTransport()
+
+def webhook_post(url, endpoint, timeout=15, **kwargs):
+    """POST to an Apps Script / form endpoint through the shared transport."""
+    return get_webhook_transport().post(url, endpoint, timeout=timeout, **kwargs)
+
 # --- 🛰️ UTILITIES & BRAIN FUNCTIONS ---
 
 import streamlit as st
 import time
 
 def show_future_intercept_intro():
-    intro_placeholder = st.empty()
-    
     # ADVANCED BUILD: Large-Scale Glowing Starfield + 10s Tactical Sequence
     st.markdown("""
         <style>
@@ -277,47 +1489,127 @@ def show_future_intercept_intro():
         </style>
     """, unsafe_allow_html=True)
 
-    with intro_placeholder.container():
-        st.markdown("""
-            <div class="intercept-container">
-                <div class="starfield-slow"></div>
-                <div class="starfield-main"></div>
-                <div class="logo-box">
-                    <h1 class="main-title">VOID-OS</h1>
-                    <div class="glitch-line"></div>
-                    <p class="tagline">PREDICT. INTEGRATE. CONQUER.</p>
-                </div>
+    # Tactical sequence runs entirely client-side: each step is a CSS keyframe
+    # slot, so the script thread moves straight on to the login gate.
+    tactical_steps = [
+        "SCANNING TEMPORAL VECTORS...",
+        "SYNTHESIZING MARKET LOGIC...",
+        "DECRYPTING COMPETITOR STACKS...",
+        "ESTABLISHING SOVEREIGN UPLINK...",
+        "INJECTING VOID-CORE v1.0...",
+        "SYSTEMS ONLINE."
+    ]
+    step_time = INTRO_STEP_SECONDS
+    total_time = step_time * len(tactical_steps)
+
+    step_html = "".join(
+        f"<p class='intercept-step' style='animation-delay:{i * step_time}s;"
+        f"{' animation-name: step-hold;' if i == len(tactical_steps) - 1 else ''}'>{step}</p>"
+        for i, step in enumerate(tactical_steps)
+    )
+
+    st.markdown(f"""
+        <style>
+        .intercept-container {{
+            animation: intercept-dismiss 0.6s ease-in forwards {total_time}s;
+        }}
+        .intercept-step {{
+            position: fixed; bottom: 12%; width: 100%; left: 0; z-index: 10000;
+            text-align: center; color: rgba(0, 242, 255, 0.7);
+            font-family: monospace; font-size: 0.75rem; letter-spacing: 6px;
+            text-shadow: 0 0 15px rgba(0, 242, 255, 0.4);
+            opacity: 0; pointer-events: none;
+            animation: step-flash {step_time}s steps(1, end) forwards;
+        }}
+        @keyframes step-flash {{
+            0% {{ opacity: 1; }}
+            100% {{ opacity: 0; }}
+        }}
+        @keyframes step-hold {{
+            0%, 100% {{ opacity: 1; }}
+        }}
+        @keyframes intercept-dismiss {{
+            to {{ opacity: 0; visibility: hidden; pointer-events: none; }}
+        }}
+        /* Any click on the overlay dismisses it, so the gate is usable at once */
+        #intercept-skip {{ display: none; }}
+        #intercept-skip:checked + .intercept-container {{ display: none; }}
+        .intercept-container {{ cursor: pointer; }}
+        .intercept-skip-hint {{
+            position: absolute; top: 24px; right: 32px; pointer-events: none;
+            font-family: monospace; font-size: 0.65rem; letter-spacing: 4px; color: rgba(255, 255, 255, 0.35);
+        }}
+        </style>
+        <input type="checkbox" id="intercept-skip">
+        <label for="intercept-skip" class="intercept-container">
+            <span class="intercept-skip-hint">CLICK TO SKIP</span>
+            <div class="starfield-slow"></div>
+            <div class="starfield-main"></div>
+            <div class="logo-box">
+                <h1 class="main-title">VOID-OS</h1>
+                <div class="glitch-line"></div>
+                <p class="tagline">PREDICT. INTEGRATE. CONQUER.</p>
             </div>
-        """, unsafe_allow_html=True)
-        
-        status_placeholder = st.empty()
-        
-        tactical_steps = [
-            "SCANNING TEMPORAL VECTORS...",
-            "SYNTHESIZING MARKET LOGIC...",
-            "DECRYPTING COMPETITOR STACKS...",
-            "ESTABLISHING SOVEREIGN UPLINK...",
-            "INJECTING VOID-CORE v1.0...",
-            "SYSTEMS ONLINE."
-        ]
-        
-        # Timing: 6 steps * 1.6s = ~9.6 seconds total immersion
-        for step in tactical_steps:
-            status_placeholder.markdown(f"""
-                <div style='position:fixed; bottom:12%; width:100%; left:0; z-index:10000;'>
-                    <p style='text-align:center; color:rgba(0, 242, 255, 0.7); 
-                    font-family:monospace; font-size:0.75rem; letter-spacing:6px;
-                    text-shadow: 0 0 15px rgba(0, 242, 255, 0.4);'>
-                    {step}
-                    </p>
-                </div>
-            """, unsafe_allow_html=True)
-            time.sleep(1.6)
-            
-    intro_placeholder.empty()
+            {step_html}
+        </label>
+    """, unsafe_allow_html=True)
+
+# --- BOOT SEQUENCE CONFIG ---
+# BOOT_INTRO: "always" | "first_visit" (skip for returning sessions) | "off"
+BOOT_INTRO_MODE = str(get_void_secret("BOOT_INTRO", "first_visit")).strip().lower()
+INTRO_STEP_SECONDS = 1.6
+
+@st.cache_resource
+def get_boot_executor():
+    """Process-wide worker that warms login-gate data while the intro plays."""
+    return ContextThreadPoolExecutor(max_workers=2, thread_name_prefix="void-boot")
+
+@st.cache_resource
+def get_fanout_executor():
+    """Shared pool for page-level fan-out of independent network sources."""
+    return ContextThreadPoolExecutor(max_workers=16, thread_name_prefix="void-fanout")
+
+# Batch LLM work (ingest map/reduce, audit chunks, memory folds) parks on the
+# rate limiter, so it gets its own small pool: only LLM_BULK_WORKERS calls queue
+# for quota at once, which keeps each wait well under RATE_LIMIT_MAX_WAIT and
+# leaves the fan-out pool free for news fetches and stream pumps.
+LLM_BULK_WORKERS = 4
+
+@st.cache_resource
+def get_llm_bulk_executor():
+    return ContextThreadPoolExecutor(max_workers=LLM_BULK_WORKERS, thread_name_prefix="void-llm-bulk")
+
+def collect_source(future, deadline, fallback=None):
+    """Result of a fanned-out source, or `fallback` once its deadline (monotonic) passes."""
+    try:
+        return future.result(timeout=max(0.0, deadline - time.monotonic()))
+    except Exception:
+        return fallback
+
+@st.cache_resource
+def get_boot_metrics():
+    """Rolling login-gate render times (ms) shared by every session."""
+    from collections import deque
+    return deque(maxlen=500)
+
+def record_time_to_interactive():
+    """Logs once per session how long the server took to render the login gate.
+
+    This is server-side only; the intro overlay can be dismissed with a click,
+    so the gate is usable as soon as it has rendered."""
+    started = st.session_state.get('boot_started_at')
+    if started is None or 'boot_tti_ms' in st.session_state:
+        return
+    st.session_state.boot_tti_ms = round((time.perf_counter() - started) * 1000, 1)
+    get_boot_metrics().append(st.session_state.boot_tti_ms)
 
 if 'booted' not in st.session_state:
-    show_future_intercept_intro()
+    st.session_state.boot_started_at = time.perf_counter()
+    returning = st.query_params.get("uplink") == "1"
+    if BOOT_INTRO_MODE == "always" or (BOOT_INTRO_MODE == "first_visit" and not returning):
+        show_future_intercept_intro()
+    # Marks the URL so a refresh / revisit counts as a returning session
+    st.query_params["uplink"] = "1"
     st.session_state.booted = True
 
 def draw_title(emoji, text):
@@ -486,13 +1778,174 @@ def save_script_to_vault(title, content):
         "content": content
     }
     try:
-        requests.post(NEW_URL, json=payload, timeout=5)
+        webhook_post(NEW_URL, "SAVE_SCRIPT", json=payload, timeout=5)
         st.success("📜 Script archived in your Private Vault.")
     except:
         st.error("Uplink failed.")
 
 import pandas as pd
 
+# --- 🗄️ DURABLE LOCAL STORE (SQLITE / WAL) ---
+# Script history, pitch logs and Growth Hub tasks live in an embedded WAL-mode
+# SQLite file, partitioned by user email and indexed by (email, kind, created_at),
+# so pages read one page of rows instead of rebuilding from the vault CSV.
+# Search runs over a lowercased copy of the payload values only (never the keys).
+VOID_STORE_PATH = os.path.join(VOID_DATA_DIR, "void_store.sqlite3")
+
+class VoidStore:
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS records (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                email TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                fingerprint TEXT UNIQUE,
+                payload TEXT NOT NULL,
+                search_text TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_records_partition
+                ON records (email, kind, created_at DESC);
+            CREATE TABLE IF NOT EXISTS documents (
+                email TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (email, kind)
+            );
+        """)
+        self._migrate()
+
+    def _migrate(self):
+        """Adds and backfills search_text on stores created before it existed."""
+        columns = {row["name"] for row in self._db.execute("PRAGMA table_info(records)")}
+        if "search_text" in columns:
+            return
+        with self._db:
+            self._db.execute("ALTER TABLE records ADD COLUMN search_text TEXT")
+            rows = self._db.execute("SELECT id, payload FROM records").fetchall()
+            self._db.executemany(
+                "UPDATE records SET search_text = ? WHERE id = ?",
+                [(self._search_text(json.loads(r["payload"])), r["id"]) for r in rows],
+            )
+
+    @staticmethod
+    def _partition(email):
+        return str(email or "unknown").strip().lower()
+
+    @staticmethod
+    def _encode(payload):
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+    @staticmethod
+    def _search_text(payload):
+        values = payload.values() if isinstance(payload, dict) else [payload]
+        return "\n".join(str(v) for v in values if v is not None).lower()
+
+    def append_many(self, email, kind, rows):
+        """rows: iterable of (payload, created_at, fingerprint). Duplicate fingerprints are skipped."""
+        params = [
+            (self._partition(email), kind, created_at or time.time(), fingerprint,
+             self._encode(payload), self._search_text(payload))
+            for payload, created_at, fingerprint in rows
+        ]
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO records (email, kind, created_at, fingerprint, payload, search_text) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                params,
+            )
+
+    def append(self, email, kind, payload, created_at=None, fingerprint=None):
+        self.append_many(email, kind, [(payload, created_at, fingerprint)])
+
+    def _where(self, email, kind, search):
+        clause, args = "email = ? AND kind = ?", [self._partition(email), kind]
+        if search:
+            # SQLite's LIKE only folds ASCII, so both sides are lowercased in Python
+            pattern = search.strip().lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            clause += " AND search_text LIKE ? ESCAPE '\\'"
+            args.append(f"%{pattern}%")
+        return clause, args
+
+    def count(self, email, kind, search=""):
+        clause, args = self._where(email, kind, search)
+        with self._lock:
+            return self._db.execute(f"SELECT COUNT(*) FROM records WHERE {clause}", args).fetchone()[0]
+
+    def page(self, email, kind, limit=10, offset=0, search=""):
+        """Newest-first page of payload dicts; each carries its row id as '_id'."""
+        clause, args = self._where(email, kind, search)
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT id, payload FROM records WHERE {clause} ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
+                args + [limit, offset],
+            ).fetchall()
+        return [{**json.loads(r["payload"]), "_id": r["id"]} for r in rows]
+
+    def update(self, record_id, payload):
+        payload = {k: v for k, v in payload.items() if k != "_id"}
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE records SET payload = ?, search_text = ? WHERE id = ?",
+                (self._encode(payload), self._search_text(payload), record_id),
+            )
+
+    def get_doc(self, email, kind, default=None):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT payload FROM documents WHERE email = ? AND kind = ?", (self._partition(email), kind)
+            ).fetchone()
+        return json.loads(row["payload"]) if row else default
+
+    def put_doc(self, email, kind, payload):
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO documents (email, kind, updated_at, payload) VALUES (?, ?, ?, ?)",
+                (self._partition(email), kind, time.time(), self._encode(payload)),
+            )
+
+@st.cache_resource
+def get_void_store():
+    return VoidStore(VOID_STORE_PATH)
+
+def script_fingerprint(row):
+    """Same script from the local forge and the cloud vault collapses to one record."""
+    parts = [str(row.get(k, "")).strip() for k in ("Email", "Platform", "Topic", "Generated Script")]
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+def archive_script(platform, topic, script, visual_dna):
+    """Writes a generated script into the caller's local archive partition."""
+    email = st.session_state.get('user_email', 'unknown')
+    row = {
+        "Timestamp": dt.now().strftime("%Y-%m-%d %H:%M"),
+        "User Name": st.session_state.get('user_name', 'Operator'),
+        "Email": email,
+        "Platform": platform,
+        "Topic": topic,
+        "Generated Script": script,
+        "Visual Dna": visual_dna,
+        "Status": "pending",
+    }
+    get_void_store().append(email, "script", row, fingerprint=script_fingerprint(row))
+
+TASK_COLUMNS = ["Task", "Node", "Status", "Deadline"]
+
+def ensure_user_tasks():
+    """Loads the Growth Hub task board from the store once per session."""
+    if 'tasks' not in st.session_state:
+        saved = get_void_store().get_doc(st.session_state.get('user_email'), "tasks", [])
+        st.session_state.tasks = pd.DataFrame(saved, columns=TASK_COLUMNS)
+
+def save_user_tasks():
+    get_void_store().put_doc(st.session_state.get('user_email'), "tasks", st.session_state.tasks.to_dict('records'))
+
 def sync_history_from_cloud():
     try:
         # Pull the link from our Security Bridge
@@ -510,8 +1963,14 @@ def sync_history_from_cloud():
         
         if not df.empty:
             if 'Email' in df.columns:
-                user_df = df[df['Email'] == user_email]
-                st.session_state.script_history = user_df.to_dict('records')
+                user_df = df[df['Email'] == user_email].fillna("")
+                stamps = pd.to_datetime(user_df.get('Timestamp'), errors='coerce') if 'Timestamp' in user_df.columns else None
+                rows = []
+                for i, row in enumerate(user_df.to_dict('records')):
+                    ts = stamps.iloc[i] if stamps is not None else pd.NaT
+                    rows.append((row, None if pd.isna(ts) else ts.timestamp(), script_fingerprint(row)))
+                # Merge into the local archive; rows already present are skipped
+                get_void_store().append_many(user_email, "script", rows)
                 return True
         return False
     except Exception as e:
@@ -533,76 +1992,260 @@ def ask_void_agent(user_query, context_data):
     response = call_gemini_api(prompt) 
     return response
 
-# --- ENHANCED DATA LOADER (CACHE BYPASS) ---
-@st.cache_data(ttl=0)
-def load_user_db():
+# --- 🗂️ SHARED SHEET CACHE (STALE-WHILE-REVALIDATE) ---
+# Every session reads the last good copy of a published sheet instantly. Once a
+# copy is older than its max_age, one background refresh per sheet revalidates it
+# with ETag / Last-Modified and skips re-parsing when the CSV body hash is unchanged.
+class SheetCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._inflight = {}
+        self._http = requests.Session()
+
+    def _fetch(self, url, transform, bust):
+        entry = self._entries.get(url, {})
+        headers = {"User-Agent": "Mozilla/5.0"}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        # Published sheets sit behind Google's edge cache; a bust param keeps the copy live
+        fetch_url = f"{url}{'&' if '?' in url else '?'}cache_bust={time.time()}" if bust else url
+
+        res = self._http.get(fetch_url, headers=headers, timeout=10)
+        if res.status_code == 304 and "df" in entry:
+            return {**entry, "fetched_at": time.time()}
+        res.raise_for_status()
+
+        body_hash = hashlib.sha256(res.content).hexdigest()
+        if body_hash == entry.get("hash") and "df" in entry:
+            df = entry["df"]
+        else:
+            df = transform(pd.read_csv(io.StringIO(res.text)))
+        return {
+            "df": df,
+            "hash": body_hash,
+            "etag": res.headers.get("ETag"),
+            "last_modified": res.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+        }
+
+    def _refresh(self, url, transform, bust):
+        """Single-flight refresh: concurrent callers wait on the one request in flight."""
+        with self._lock:
+            done = self._inflight.get(url)
+            leader = done is None
+            if leader:
+                done = self._inflight[url] = threading.Event()
+        if not leader:
+            done.wait(timeout=15)
+            return
+        try:
+            fresh = self._fetch(url, transform, bust)
+            with self._lock:
+                self._entries[url] = fresh
+        finally:
+            with self._lock:
+                self._inflight.pop(url, None)
+            done.set()
+
+    def get(self, url, transform, max_age, bust=False, force=False):
+        entry = self._entries.get(url)
+        if entry is None or force:
+            self._refresh(url, transform, bust)
+            entry = self._entries.get(url)
+            if entry is None:
+                raise RuntimeError("sheet unavailable")
+        elif time.time() - entry["fetched_at"] > max_age and url not in self._inflight:
+            threading.Thread(target=self._quiet_refresh, args=(url, transform, bust), daemon=True).start()
+        return entry["df"]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _quiet_refresh(self, url, transform, bust):
+        try:
+            self._refresh(url, transform, bust)
+        except Exception:
+            pass  # Keep serving the last good copy
+
+@st.cache_resource
+def get_sheet_cache():
+    return SheetCache()
+
+def _clean_user_sheet(df):
+    # 2. CLEANING: Remove hidden spaces but KEEP the casing
+    df.columns = [str(c).strip() for c in df.columns]
+    # 3. VALUE SANITIZATION: Critical for Tier Matching
+    if 'Status' in df.columns:
+        # This makes "Pro " become "Pro" so the mapping works perfectly
+        df['Status'] = df['Status'].astype(str).str.strip()
+    return df
+
+def _clean_lower_columns(df):
+    df.columns = [str(c).strip().lower() for c in df.columns]
+    return df
+
+MARKET_COLUMNS = ['niche name', 'growth', 'score', 'saturation', 'status', 'reason']
+
+def _clean_market_sheet(df):
+    """Normalizes the pulse CSV once into the typed market feature table.
+
+    Columns: niche name (str, also the unnamed index), growth / score (float64),
+    saturation / status (category, status = get_saturation_status(score)), reason (str).
+    """
+    df = _clean_lower_columns(df)
+    # Positional fallbacks are resolved here, once, instead of on every render
+    if 'niche name' not in df.columns and len(df.columns) > 0:
+        df = df.rename(columns={df.columns[0]: 'niche name'})
+    if 'growth' not in df.columns and len(df.columns) > 2:
+        df = df.rename(columns={df.columns[2]: 'growth'})
+    for col, default in (('niche name', ''), ('growth', 0), ('score', 0), ('saturation', 'unknown'), ('reason', '')):
+        if col not in df.columns:
+            df[col] = default
+
+    # --- THE FIX: SCRUB THE GROWTH COLUMN (LOGIC PRESERVED) ---
+    # Remove %, commas, and whitespace, then convert to float
+    df['growth'] = df['growth'].astype(str).str.replace('%', '').str.replace(',', '').str.strip()
+    df['growth'] = pd.to_numeric(df['growth'], errors='coerce').fillna(0).astype('float64')
+    df['score'] = pd.to_numeric(df['score'], errors='coerce').fillna(0).astype('float64')
+    df['status'] = df['score'].map(get_saturation_status).astype('category')
+    df['saturation'] = df['saturation'].fillna('unknown').astype(str).str.strip().astype('category')
+    df['reason'] = df['reason'].fillna('').astype(str)
+
+    df['niche name'] = df['niche name'].astype(str).str.strip()
+    df = df[df['niche name'] != ''].drop_duplicates(subset='niche name', keep='first')
+    extra = [c for c in df.columns if c not in MARKET_COLUMNS]
+    df = df[MARKET_COLUMNS + extra]
+    # Niche lookups are index hits: pulse_df.loc[name]
+    df.index = pd.Index(df['niche name'].to_numpy(), name=None)
+    return df
+
+# --- ENHANCED DATA LOADER (SHARED CACHE) ---
+def load_user_db(fresh=False):
+    """User sheet via the shared cache. fresh=True forces a synchronous revalidation."""
+    if USER_DB_URL == "RESTRICTED":
+        return pd.DataFrame()
     try:
-        # 1. THE CACHE BUSTER: Ensures we bypass both Streamlit and Google's internal cache
-        seed = random.randint(1000, 9999)
-        sync_url = f"{USER_DB_URL}&cache_bust={time.time()}&seed={seed}"
-        
-        df = pd.read_csv(sync_url)
-        
-        # 2. CLEANING: Remove hidden spaces but KEEP the casing
-        df.columns = [str(c).strip() for c in df.columns]
-        
-        # 3. VALUE SANITIZATION: Critical for Tier Matching
-        if 'Status' in df.columns:
-            # This makes "Pro " become "Pro" so the mapping works perfectly
-            df['Status'] = df['Status'].astype(str).str.strip()
-            
-        return df
+        return get_sheet_cache().get(USER_DB_URL, _clean_user_sheet, max_age=30, bust=True, force=fresh)
     except Exception as e:
         st.error(f"🛰️ DATABASE UPLINK ERROR: {e}")
         return pd.DataFrame()
 
 def load_history_db():
+    # Pull from secrets, fallback to restricted for safety
+    history_url = get_void_secret("HISTORY_DB_URL", "RESTRICTED")
+    if history_url == "RESTRICTED":
+        return pd.DataFrame()
     try:
-        # Pull from secrets, fallback to restricted for safety
-        history_url = get_void_secret("HISTORY_DB_URL", "RESTRICTED")
-        
-        if history_url == "RESTRICTED":
-            return pd.DataFrame()
-
-        # Added the cache-busting timestamp logic back in
-        df = pd.read_csv(f"{history_url}&cache={time.time()}")
-        df.columns = [str(c).strip().lower() for c in df.columns]
-        return df
+        return get_sheet_cache().get(history_url, _clean_lower_columns, max_age=60, bust=True)
     except Exception as e:
         # Vague error for public security
         st.error("Vault Connection Offline.")
         return pd.DataFrame()
 
-def fetch_live_market_data():
+# --- 📈 MARKET PULSE SNAPSHOT SERVICE ---
+# A daemon thread refreshes MARKET_PULSE_URL on a schedule and publishes an
+# immutable, versioned snapshot. Every session reads the same snapshot, so
+# Global Pulse / Trend Duel reruns (keystrokes, multiselects) never hit the network.
+# Consumers must treat snapshot.df as read-only (copy before mutating).
+MARKET_REFRESH_SECONDS = 120
+MarketSnapshot = namedtuple("MarketSnapshot", ["version", "fetched_at", "df"])
+
+MARKET_SNAPSHOT_PATH = os.path.join(VOID_DATA_DIR, "market_snapshot.parquet")
+
+class MarketPulseService:
+    def __init__(self, url, sheet_cache, interval=MARKET_REFRESH_SECONDS):
+        self._url = url
+        self._sheet_cache = sheet_cache
+        self._interval = interval
+        self._snapshot = MarketSnapshot(0, 0.0, pd.DataFrame())
+        self._ready = threading.Event()
+        self._wake = threading.Event()
+        self._load_from_disk()
+        threading.Thread(target=self._run, name="void-market-pulse", daemon=True).start()
+
+    def _load_from_disk(self):
+        """Warm restart: serve the last persisted table before the first network fetch."""
+        try:
+            df = pd.read_parquet(MARKET_SNAPSHOT_PATH)
+        except Exception:
+            return
+        self._snapshot = MarketSnapshot(1, os.path.getmtime(MARKET_SNAPSHOT_PATH), df)
+        self._ready.set()
+
+    def _persist(self, df):
+        try:
+            os.makedirs(VOID_DATA_DIR, exist_ok=True)
+            tmp_path = f"{MARKET_SNAPSHOT_PATH}.tmp"
+            df.to_parquet(tmp_path)
+            os.replace(tmp_path, MARKET_SNAPSHOT_PATH)
+        except Exception:
+            pass  # Disk is an optimization only
+
+    def _run(self):
+        while True:
+            try:
+                df = self._sheet_cache.get(self._url, _clean_market_sheet, max_age=0, force=True)
+                current = self._snapshot
+                if df is not current.df:
+                    self._snapshot = MarketSnapshot(current.version + 1, time.time(), df)
+                    self._persist(df)
+                else:
+                    self._snapshot = current._replace(fetched_at=time.time())
+            except Exception:
+                pass  # Keep publishing the last good snapshot
+            finally:
+                self._ready.set()
+            self._wake.wait(self._interval)
+            self._wake.clear()
+
+    def snapshot(self, wait=0):
+        """Latest snapshot. `wait` only applies before the first fetch of the process."""
+        if wait and not self._ready.is_set():
+            self._ready.wait(wait)
+        return self._snapshot
+
+    def refresh_now(self):
+        self._wake.set()
+
+@st.cache_resource
+def get_market_service(url):
+    return MarketPulseService(url, get_sheet_cache())
+
+def get_market_snapshot():
     # Uses your existing MARKET_PULSE_URL secret
     url = get_void_secret("MARKET_PULSE_URL", "RESTRICTED")
-    
     if url == "RESTRICTED":
-        return pd.DataFrame()
+        return MarketSnapshot(0, 0.0, pd.DataFrame())
+    # Only a cold process blocks (once, bounded) for the very first snapshot
+    return get_market_service(url).snapshot(wait=10)
 
-    try:
-        res = requests.get(url, timeout=10)
-        df = pd.read_csv(io.StringIO(res.text))
-        df.columns = [str(c).strip().lower() for c in df.columns]
-        
-        # --- THE FIX: SCRUB THE GROWTH COLUMN (LOGIC PRESERVED) ---
-        if 'growth' in df.columns:
-            # Remove %, commas, and whitespace, then convert to float
-            df['growth'] = df['growth'].astype(str).str.replace('%', '').str.replace(',', '').str.strip()
-            df['growth'] = pd.to_numeric(df['growth'], errors='coerce').fillna(0)
-            
-        return df
-    except Exception as e:
+def fetch_live_market_data():
+    snapshot = get_market_snapshot()
+    if snapshot.version == 0 and MARKET_PULSE_URL != "RESTRICTED":
         st.error("Market Uplink Error.")
-        return pd.DataFrame()
+    return snapshot.df
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_live_news_cached(query, api_key):
+    # Raises on any failure: st.cache_data must only ever keep real answers
+    url = f"https://newsapi.org/v2/everything?q={query}&sortBy=relevancy&language=en&pageSize=5&apiKey={api_key}"
+
+    def fetch():
+        res = requests.get(url, timeout=7)
+        res.raise_for_status()
+        return res.json().get('articles', [])
+
+    return get_single_flight().do(("news", url), fetch)
 
 def fetch_live_news(query, api_key):
     """Fetches real-time world intelligence based on active vectors."""
-    url = f"https://newsapi.org/v2/everything?q={query}&sortBy=relevancy&language=en&pageSize=5&apiKey={api_key}"
     try:
-        res = requests.get(url, timeout=7)
-        return res.json().get('articles', []) if res.status_code == 200 else []
-    except:
+        return _fetch_live_news_cached(query, api_key)
+    except Exception:
         return []
         
 def generate_visual_dna(platform, tone):
@@ -629,7 +2272,7 @@ def trigger_upgrade():
 def get_intel_image(entry):
     try:
         if 'media_content' in entry: return entry.media_content[0]['url']
-        soup = BeautifulSoup(entry.summary, 'html.parser')
+        soup = bs4.BeautifulSoup(entry.summary, 'html.parser')
         img = soup.find('img')
         if img: return img['src']
     except: pass
@@ -650,7 +2293,7 @@ def transmit_script(client, platform, topic, script, dna):
     payload = {"client": client, "platform": platform, "topic": topic, "script": script, "dna": dna}
     try:
         # Standard payload logic preserved
-        response = requests.post(url, data=payload)
+        response = webhook_post(url, "TRANSMIT_SCRIPT", data=payload)
         return response.status_code == 200
     except: 
         return False
@@ -669,37 +2312,191 @@ def generate_oracle_report(topic, platform, tone):
         )
         
         # Ensure groq_c is initialized in your environment
-        res = groq_c.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            messages=[{"role": "user", "content": prompt}]
-        )
-        return res.choices[0].message.content
+        return llm_complete("strategy", [{"role": "user", "content": prompt}])
     except Exception as e:
         return f"Oracle connection interrupted: {e}"
 
-def get_live_stats(url):
-    if not url: return None, None
-    is_ig = "instagram.com" in url.lower()
-    
-    ydl_opts = {
-        'quiet': True,
-        'no_warnings': True,
-        'skip_download': True,
-        'extract_flat': True,
-        'http_headers': {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
-            'Accept-Language': 'en-US,en;q=0.9',
-        }
-    }
+# --- ⛏️ YT-DLP EXTRACTION POOL ---
+# Every yt_dlp metadata call runs on this bounded pool, never on the script
+# thread. Pages keep the futures and poll them from a fragment up to a deadline;
+# a job that misses it is cancelled if it has not started, and a started one is
+# bounded by yt_dlp's own socket timeout.
+YTDLP_WORKERS = 4
+YTDLP_DEADLINE_SECONDS = 20
+YTDLP_SOCKET_TIMEOUT = 10
+
+@st.cache_resource
+def get_ytdlp_executor():
+    return ContextThreadPoolExecutor(max_workers=YTDLP_WORKERS, thread_name_prefix="void-ytdlp")
+
+# --- 📈 CREATOR STATS SERVICE ---
+# One process-wide service for public channel/profile stats. Results are cached
+# per canonical profile URL with a TTL (the last good result is kept past it),
+# batches resolve concurrently, and every result carries its fetch time.
+STATS_TTL_SECONDS = 900
+STATS_YDL_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'skip_download': True,
+    'extract_flat': True,
+    'socket_timeout': YTDLP_SOCKET_TIMEOUT,
+    'http_headers': {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
+        'Accept-Language': 'en-US,en;q=0.9',
+    },
+}
 
-    try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            subs = info.get('follower_count') or info.get('subscriber_count')
-            views = info.get('view_count', 0)
-            return subs, views
-    except Exception:
+CreatorStats = namedtuple("CreatorStats", ["url", "subs", "views", "fetched_at", "error"])
+
+def canonical_profile_url(url):
+    """Normalizes a channel/profile URL so variants of the same profile share one cache entry."""
+    url = str(url or "").strip()
+    if not url:
+        return ""
+    if "://" not in url:
+        url = "https://" + url
+    parsed = urllib.parse.urlparse(url)
+    host = parsed.netloc.lower()
+    for prefix in ("www.", "m.", "mobile."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    if host == "twitter.com":
+        host = "x.com"
+    parts = [p for p in parsed.path.split("/") if p]
+    if host == "youtube.com" and parts:
+        # /@handle/videos, /channel/UC.../featured -> the channel root
+        keep = 2 if parts[0] in ("channel", "c", "user") else 1
+        parts = parts[:keep]
+    elif host in ("instagram.com", "x.com", "tiktok.com") and parts:
+        parts = parts[:1]
+    path = "/".join(parts)
+    if host == "youtube.com" and parts and parts[0] in ("watch", "shorts", "embed", "live"):
+        video_id = youtube_video_id(url)
+        if video_id:
+            return f"https://youtube.com/watch?v={video_id}"
+    return f"https://{host}/{path}" if path else f"https://{host}"
+
+class CreatorStatsService:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}  # canonical url -> CreatorStats (last good result)
+        self._local = threading.local()
+
+    def _ydl(self):
+        # YoutubeDL is not thread-safe; each worker thread keeps and reuses its own instance
+        ydl = getattr(self._local, "ydl", None)
+        if ydl is None:
+            ydl = self._local.ydl = yt_dlp.YoutubeDL(STATS_YDL_OPTS)
+        return ydl
+
+    @staticmethod
+    def _extraction_url(url):
+        # With extract_flat a YouTube channel root lists its tabs, not uploads
+        parsed = urllib.parse.urlparse(url)
+        if parsed.netloc == "youtube.com" and parsed.path.strip("/") and not parsed.path.startswith("/watch"):
+            return url.rstrip("/") + "/videos"
+        return url
+
+    def _extract(self, url):
+        info = self._ydl().extract_info(self._extraction_url(url), download=False)
+        subs = info.get('channel_follower_count') or info.get('follower_count') or info.get('subscriber_count')
+        views = info.get('view_count')
+        if views is None:
+            # Channel pages: sum the views of the five latest uploads
+            views = sum(v.get('view_count') or 0 for v in (info.get('entries') or [])[:5])
+        return CreatorStats(url, subs, views or 0, time.time(), None)
+
+    def _fetch(self, url):
+        try:
+            stats = get_single_flight().do(("stats", url), self._extract, url)
+        except Exception as e:
+            cached = self.cached(url)
+            return cached._replace(error=str(e)) if cached else CreatorStats(url, None, None, time.time(), str(e))
+        with self._lock:
+            self._entries[url] = stats
+        return stats
+
+    def cached(self, url):
+        with self._lock:
+            return self._entries.get(canonical_profile_url(url))
+
+    def submit_many(self, urls, max_age=STATS_TTL_SECONDS):
+        """{input url: Future[CreatorStats]}; fresh cache hits come back already resolved."""
+        canon = {url: canonical_profile_url(url) for url in urls if url}
+        now = time.time()
+        futures = {}
+        for target in set(canon.values()):
+            hit = self.cached(target)
+            if hit is not None and now - hit.fetched_at <= max_age:
+                futures[target] = Future()
+                futures[target].set_result(hit)
+            else:
+                futures[target] = get_ytdlp_executor().submit(self._fetch, target)
+        return {url: futures[target] for url, target in canon.items()}
+
+    def collect(self, futures, deadline):
+        """Results for submit_many() futures by `deadline` (monotonic). Late ones are cancelled and
+        fall back to the last cached stats, flagged with a deadline error."""
+        results, settled = {}, {}
+        for url, future in futures.items():
+            # URLs with the same canonical profile share one future: settle it once
+            if future not in settled:
+                try:
+                    settled[future] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except (FuturesTimeout, CancelledError):
+                    future.cancel()
+                    settled[future] = None
+            if settled[future] is not None:
+                results[url] = settled[future]
+                continue
+            cached = self.cached(url)
+            error = f"deadline exceeded after {YTDLP_DEADLINE_SECONDS}s"
+            results[url] = cached._replace(error=error) if cached else CreatorStats(url, None, None, time.time(), error)
+        return results
+
+    def get_many(self, urls, max_age=STATS_TTL_SECONDS, timeout=YTDLP_DEADLINE_SECONDS):
+        """{input url: CreatorStats} for a batch, resolved concurrently within `timeout`."""
+        return self.collect(self.submit_many(urls, max_age), time.monotonic() + timeout)
+
+    def get(self, url, max_age=STATS_TTL_SECONDS):
+        return self.get_many([url], max_age).get(url)
+
+@st.cache_resource
+def get_stats_service():
+    return CreatorStatsService()
+
+def get_live_stats(url):
+    """(subs, views) for a profile URL via the shared stats service; (None, None) when unavailable."""
+    if not url:
         return None, None
+    stats = get_stats_service().get(url)
+    return (stats.subs, stats.views) if stats and stats.subs is not None else (None, None)
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def stats_sync_monitor():
+    """Polls a Growth Hub stats batch; lands the results (or cached fallbacks) once done or past its deadline."""
+    sync = st.session_state.stats_sync
+    futures = sync["futures"]
+    pending = sum(1 for f in futures.values() if not f.done())
+    if pending and time.monotonic() < sync["deadline"]:
+        st.progress(1 - pending / len(futures), text=f"Decoding Meta-Streams... {len(futures) - pending}/{len(futures)} profiles")
+        return
+
+    batch = get_stats_service().collect(futures, sync["deadline"])
+    stats = batch[sync["target"]]
+    if stats.subs:
+        st.session_state.current_count = stats.subs
+        st.session_state.total_views = stats.views
+        st.session_state.stats_sync_notice = ("success", f"Uplink Established: {stats.subs:,} detected."
+                                              + (f" (cached — {stats.error})" if stats.error else ""))
+    elif stats.error:
+        st.session_state.stats_sync_notice = ("error", f"Uplink Failed: {stats.error}")
+    st.session_state.profile_stats = {
+        url: {"subs": r.subs, "views": r.views, "as_of": dt.fromtimestamp(r.fetched_at).strftime("%H:%M:%S")}
+        for url, r in batch.items()
+    }
+    del st.session_state.stats_sync
+    st.rerun()
 
 # 4. SESSION STATE
 if 'user_profiles' not in st.session_state:
@@ -713,33 +2510,6 @@ if 'user_profiles' not in st.session_state:
 if 'logged_in' not in st.session_state:
     st.session_state.logged_in = False
 
-# --- UPDATED INTERCEPTOR ---
-def get_live_stats(url):
-    if not url: return None, None
-    
-    # Identify platform
-    is_ig = "instagram.com" in url.lower()
-    
-    ydl_opts = {
-        'quiet': True,
-        'no_warnings': True,
-        'skip_download': True,
-        'extract_flat': True,
-        'http_headers': {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
-            'Accept-Language': 'en-US,en;q=0.9',
-        }
-    }
-
-    try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            subs = info.get('follower_count') or info.get('subscriber_count')
-            views = info.get('view_count', 0)
-            return subs, views
-    except Exception:
-        return None, None
-
 def display_feedback_tab():
     st.header("🧠 Neural Feedback Loop")
     st.write("Is the VOID OS performing to your standards? Submit your logs below.")
@@ -755,7 +2525,7 @@ def display_feedback_tab():
             if message:
                 payload = {"email": email, "category": category, "message": message}
                 try:
-                    response = requests.post(FEEDBACK_API_URL, json=payload)
+                    response = webhook_post(FEEDBACK_API_URL, "FEEDBACK", json=payload)
                     if response.status_code == 200:
                         st.success("✅ Transmission Successful. The Director has been notified.")
                         st.balloons()
@@ -766,40 +2536,134 @@ def display_feedback_tab():
             else:
                 st.warning("Cannot transmit an empty message.")
 
+# --- 📼 YOUTUBE IDS & TRANSCRIPT CACHE ---
+# One parser for every YouTube URL shape, and an on-disk transcript cache keyed
+# by (video_id, language) so a repeat scan never touches YouTube. Videos with no
+# usable captions are remembered for a while too; rate-limit errors are not cached.
+TRANSCRIPT_CACHE_PATH = os.path.join(VOID_DATA_DIR, "transcripts.sqlite3")
+TRANSCRIPT_MISS_TTL = 6 * 3600
+TRANSCRIPT_PERMANENT_ERRORS = {"TranscriptsDisabled", "NoTranscriptFound", "NoTranscriptAvailable", "VideoUnavailable"}
+YOUTUBE_ID_RE = re.compile(r"^[A-Za-z0-9_-]{11}$")
+YOUTUBE_HOSTS = {"youtube.com", "m.youtube.com", "music.youtube.com", "youtube-nocookie.com"}
+
+def youtube_video_id(url, allow_bare=False):
+    """11-char video id from watch, shorts, youtu.be, embed, live and attribution URLs; else None.
+
+    A bare id is only accepted with allow_bare=True, since any 11-char word matches the pattern.
+    """
+    url = str(url or "").strip()
+    if YOUTUBE_ID_RE.match(url):
+        return url if allow_bare else None
+    if "://" not in url:
+        url = "https://" + url
+    parsed = urllib.parse.urlparse(url)
+    host = parsed.netloc.lower().split(":")[0]
+    host = host[4:] if host.startswith("www.") else host
+    parts = [p for p in parsed.path.split("/") if p]
+    query = urllib.parse.parse_qs(parsed.query)
+    candidate = None
+    if host == "youtu.be" and parts:
+        candidate = parts[0]
+    elif host in YOUTUBE_HOSTS:
+        if parts and parts[0] in ("shorts", "embed", "v", "live", "e") and len(parts) > 1:
+            candidate = parts[1]
+        elif "v" in query:
+            candidate = query["v"][0]
+        elif parts and parts[0] == "attribution_link" and "u" in query:
+            return youtube_video_id("https://youtube.com" + query["u"][0])
+    return candidate if candidate and YOUTUBE_ID_RE.match(candidate) else None
+
+class TranscriptCache:
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS transcripts (
+                video_id TEXT NOT NULL,
+                lang TEXT NOT NULL,
+                source_lang TEXT,
+                text TEXT,
+                error TEXT,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (video_id, lang)
+            )
+        """)
+        self._stats = {"hits": 0, "fetches": 0}
+
+    def _lookup(self, video_id, lang):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT text, error, fetched_at FROM transcripts WHERE video_id = ? AND lang = ?", (video_id, lang)
+            ).fetchone()
+        if row is None:
+            return None
+        text, error, fetched_at = row
+        if text is None and time.time() - fetched_at > TRANSCRIPT_MISS_TTL:
+            return None
+        return text, error
+
+    def _store(self, video_id, lang, source_lang, text, error):
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO transcripts (video_id, lang, source_lang, text, error, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (video_id, lang, source_lang, text, error, time.time()),
+            )
+
+    def _fetch(self, video_id, lang):
+        with self._lock:
+            self._stats["fetches"] += 1
+        api = youtube_transcript_api.YouTubeTranscriptApi
+        try:
+            transcript_list = api.list_transcripts(video_id)
+            try:
+                transcript = transcript_list.find_transcript([lang])
+            except Exception:
+                # Fall back to the first available language, machine-translated
+                transcript = next(iter(transcript_list), None)
+                if transcript is None:
+                    raise RuntimeError("No usable transcripts found.")
+                transcript = transcript.translate(lang)
+            text = " ".join(part['text'] for part in transcript.fetch())
+        except Exception as e:
+            if type(e).__name__ in TRANSCRIPT_PERMANENT_ERRORS:
+                self._store(video_id, lang, None, None, type(e).__name__)
+            raise
+        self._store(video_id, lang, getattr(transcript, "language_code", None), text, None)
+        return text
+
+    def get(self, video_id, lang="en"):
+        """Transcript text, from disk when known. Raises when YouTube has none (or refuses)."""
+        cached = self._lookup(video_id, lang)
+        if cached is not None:
+            with self._lock:
+                self._stats["hits"] += 1
+            text, error = cached
+            if text is None:
+                raise RuntimeError(f"No transcript available ({error})")
+            return text
+        return get_single_flight().do(("transcript", video_id, lang), self._fetch, video_id, lang)
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats)
+
+@st.cache_resource
+def get_transcript_cache():
+    return TranscriptCache(TRANSCRIPT_CACHE_PATH)
+
 def extract_dna_from_url(url):
     """
     The Polyglot Extractor: Handles multiple languages, 
     auto-translation, and missing caption fallbacks.
     """
     try:
-        if "youtube.com" in url or "youtu.be" in url or "shorts" in url:
-            # 1. Precise ID Extraction
-            video_id = ""
-            if "shorts/" in url:
-                video_id = url.split("shorts/")[1].split("?")[0]
-            elif "v=" in url:
-                video_id = url.split("v=")[1].split("&")[0]
-            else:
-                video_id = url.split("/")[-1].split("?")[0]
-
-            # 2. Advanced Transcript Logic
+        video_id = youtube_video_id(url)
+        if video_id:
+            # Cached per (video_id, language); translation to English happens once per video
             try:
-                transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-                
-                # Priority: Try English first, then Hindi/Spanish/French to Translate
-                try:
-                    transcript = transcript_list.find_transcript(['en'])
-                except:
-                    # Look for the first available language and force translation to English
-                    available_langs = list(transcript_list._generated_transcripts.keys()) + \
-                                     list(transcript_list._manually_created_transcripts.keys())
-                    if available_langs:
-                        transcript = transcript_list.find_transcript([available_langs[0]]).translate('en')
-                    else:
-                        raise Exception("No usable transcripts found.")
-
-                full_text = " ".join([i['text'] for i in transcript.fetch()])
-                return full_text
+                return get_transcript_cache().get(video_id, "en")
 
             except Exception as sub_e:
                 # This catches 'Subtitles Disabled' or '429 Too Many Requests'
@@ -820,14 +2684,132 @@ def extract_dna_from_url(url):
         return f"EXTRACTION ERROR: {str(e)}"
 
 
-def download_media_high_res(url, format_type):
-    # Use a temporary directory so we don't clutter the server
-    temp_dir = tempfile.mkdtemp()
-    
+# --- 💾 MEDIA CACHE (CONTENT-ADDRESSED, DISK-BOUNDED) ---
+# Downloads are keyed by (source, format) so every user asking for the same
+# clip gets the file already on disk. The directory is held under a byte budget
+# by evicting the least recently served files.
+MEDIA_CACHE_DIR = os.path.join(VOID_DATA_DIR, "media_cache")
+MEDIA_CACHE_BUDGET_BYTES = int(float(get_void_secret("MEDIA_CACHE_BUDGET_MB", 2048)) * 1024 * 1024)
+MEDIA_PARTIAL_PREFIX = ".partial-"
+MEDIA_TRACKING_PARAMS = {"si", "igshid", "igsh", "feature", "fbclid", "gclid", "s", "t"}
+
+def media_source_key(url):
+    """Identity of one media item: "youtube:<id>" for YouTube, else the normalized full URL.
+
+    Unlike canonical_profile_url this never truncates the path, so two reels or
+    posts from the same account stay distinct.
+    """
+    video_id = youtube_video_id(url)
+    if video_id:
+        return f"youtube:{video_id}"
+    url = str(url or "").strip()
+    if "://" not in url:
+        url = "https://" + url
+    parsed = urllib.parse.urlparse(url)
+    host = parsed.netloc.lower()
+    for prefix in ("www.", "m.", "mobile."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    if host == "twitter.com":
+        host = "x.com"
+    query = sorted(
+        (k, v) for k, v in urllib.parse.parse_qsl(parsed.query)
+        if k not in MEDIA_TRACKING_PARAMS and not k.startswith("utm_")
+    )
+    path = parsed.path.rstrip("/") or "/"
+    return f"https://{host}{path}" + (f"?{urllib.parse.urlencode(query)}" if query else "")
+
+class MediaCache:
+    def __init__(self, root, budget_bytes):
+        os.makedirs(root, exist_ok=True)
+        self.root = root
+        self.budget_bytes = budget_bytes
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "downloads": 0, "evictions": 0}
+        # Half-finished downloads from a previous process are never valid
+        for name in os.listdir(root):
+            if name.startswith(MEDIA_PARTIAL_PREFIX):
+                shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+    @staticmethod
+    def key(url, format_type):
+        source = media_source_key(url)
+        kind = "audio" if "Audio" in format_type else "video"
+        return hashlib.sha256(f"{source}:{kind}".encode("utf-8")).hexdigest()[:32]
+
+    def _find(self, key):
+        for name in os.listdir(self.root):
+            if name.startswith(key + "."):
+                return os.path.join(self.root, name)
+        return None
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if name.startswith(MEDIA_PARTIAL_PREFIX) or not os.path.isfile(path):
+                continue
+            info = os.stat(path)
+            entries.append((info.st_mtime, info.st_size, path))
+        return entries
+
+    def _evict(self, keep):
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= self.budget_bytes:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                self._stats["evictions"] += 1
+
+    def _download(self, key, url, format_type, downloader):
+        with self._lock:
+            self._stats["downloads"] += 1
+        work_dir = os.path.join(self.root, MEDIA_PARTIAL_PREFIX + key)
+        shutil.rmtree(work_dir, ignore_errors=True)
+        os.makedirs(work_dir)
+        try:
+            produced = downloader(url, format_type, work_dir)
+            ext = os.path.splitext(produced)[1] or ".bin"
+            final_path = os.path.join(self.root, key + ext)
+            os.replace(produced, final_path)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        self._evict(keep=final_path)
+        return final_path
+
+    def fetch(self, url, format_type, downloader):
+        """Path of the cached file for (url, format), running downloader(url, format, work_dir) on a miss."""
+        key = self.key(url, format_type)
+        path = self._find(key)
+        if path:
+            os.utime(path)  # mtime is the LRU clock
+            with self._lock:
+                self._stats["hits"] += 1
+            return path
+        return get_single_flight().do(("media", key), self._download, key, url, format_type, downloader)
+
+    def stats(self):
+        entries = self._entries()
+        with self._lock:
+            return {**self._stats, "files": len(entries), "bytes": sum(size for _, size, _ in entries)}
+
+@st.cache_resource
+def get_media_cache():
+    return MediaCache(MEDIA_CACHE_DIR, MEDIA_CACHE_BUDGET_BYTES)
+
+def _download_media_to(url, format_type, work_dir):
     # THE SHIELD: Advanced Options to prevent 0.1KB corrupt files
     ydl_opts = {
         'format': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
-        'outtmpl': os.path.join(temp_dir, '%(title)s.%(ext)s'),
+        'outtmpl': os.path.join(work_dir, 'media.%(ext)s'),
         'merge_output_format': 'mp4',
         'quiet': True,
         'nocheckcertificate': True,
@@ -860,28 +2842,117 @@ def download_media_high_res(url, format_type):
             file_path = file_path.rsplit('.', 1)[0] + ".mp3"
         return file_path
 
-# --- CORE UTILITY: PRO-SYNC ENGINE ---
-def get_live_stats(url):
-    """
-    PRO FEATURE: Extracts public metadata (Subs/Views) without DRM issues.
-    """
-    ydl_opts = {
-        'quiet': True, 
-        'no_warnings': True, 
-        'extract_flat': True,
-        'skip_download': True,
-    }
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+def download_media_high_res(url, format_type):
+    # Served from the shared media cache; only a miss touches YouTube
+    return get_media_cache().fetch(url, format_type, _download_media_to)
+
+# --- 🔗 STREAM URL RESOLVER CACHE (EXPIRY-AWARE) ---
+# Signed googlevideo URLs carry their own expiry (?expire=<unix ts>, or
+# /expire/<ts>/ in manifest paths) and stay valid for hours, so a resolved URL
+# is reused until a safety margin before that moment. URLs without an expiry get
+# a short fixed TTL. Concurrent resolutions of one source share a single flight.
+STREAM_URL_SAFETY_MARGIN = 300
+STREAM_URL_DEFAULT_TTL = 600
+STREAM_URL_MAX_ENTRIES = 256
+STREAM_EXPIRE_PATH_RE = re.compile(r"/expire/(\d+)")
+
+ResolvedStream = namedtuple("ResolvedStream", ["url", "title", "expires_at"])
+
+def stream_url_expiry(url):
+    """Unix expiry embedded in a signed stream URL, or None when it carries none."""
+    parsed = urllib.parse.urlparse(str(url or ""))
+    values = urllib.parse.parse_qs(parsed.query).get("expire")
+    if not values:
+        match = STREAM_EXPIRE_PATH_RE.search(parsed.path)
+        values = [match.group(1)] if match else None
+    try:
+        return float(values[0]) if values else None
+    except ValueError:
+        return None
+
+class StreamURLCache:
+    def __init__(self, max_entries=STREAM_URL_MAX_ENTRIES):
+        from collections import OrderedDict
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.max_entries = max_entries
+        self._stats = {"hits": 0, "resolved": 0}
+
+    @staticmethod
+    def key(url):
+        return media_source_key(url)
+
+    def _lookup(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() >= entry.expires_at - STREAM_URL_SAFETY_MARGIN:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry
+
+    def _resolve(self, key, url, extractor):
+        info = extractor(url)
+        direct_url = info.get('url')
+        if not direct_url:
+            raise RuntimeError("Extractor returned no direct stream URL.")
+        expires_at = stream_url_expiry(direct_url) or time.time() + STREAM_URL_DEFAULT_TTL
+        entry = ResolvedStream(direct_url, info.get('title', 'Asset'), expires_at)
+        with self._lock:
+            self._stats["resolved"] += 1
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def resolve(self, url, extractor):
+        """ResolvedStream for url; runs extractor(url) only when no live entry exists. Blocks."""
+        key = self.key(url)
+        entry = self._lookup(key)
+        if entry is not None:
+            return entry
+        return get_single_flight().do(("uplink", key), self._resolve, key, url, extractor)
+
+    def submit(self, url, extractor):
+        """Future[ResolvedStream]; a live entry comes back already resolved, a miss runs on the yt_dlp pool."""
+        entry = self._lookup(self.key(url))
+        if entry is not None:
+            future = Future()
+            future.set_result(entry)
+            return future
+        return get_ytdlp_executor().submit(self.resolve, url, extractor)
+
+    def stats(self):
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries)}
+
+@st.cache_resource
+def get_stream_url_cache():
+    return StreamURLCache()
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def uplink_monitor():
+    """Polls a Media Uplink resolution; lands the stream (or the error) once done or past its deadline."""
+    pending = st.session_state.uplink_resolve
+    future = pending["future"]
+    if not future.done() and time.monotonic() < pending["deadline"]:
+        st.caption("🛰️ INTERCEPTING RAW STREAM VECTORS...")
+        return
+
+    if not future.done():
+        future.cancel()
+        st.session_state.uplink_result = ("error", f"extractor missed its {YTDLP_DEADLINE_SECONDS}s deadline. Try again shortly.")
+    else:
         try:
-            info = ydl.extract_info(url, download=False)
-            # Subscriber count for channels, follower count for others
-            subs = info.get('channel_follower_count') or info.get('subscriber_count', 0)
-            # Sum views of the last 5 entries
-            entries = info.get('entries', [])
-            total_views = sum([v.get('view_count', 0) for v in entries[:5] if v.get('view_count')])
-            return subs, total_views
+            st.session_state.uplink_result = ("ok", future.result())
         except Exception as e:
-            return None, None
+            st.session_state.uplink_result = ("error", str(e))
+    del st.session_state.uplink_resolve
+    st.rerun()
 
 # --- INDEPENDENT MONDAY PULSE TRIGGER ---
 # Place this before your 'if page == ...' blocks
@@ -919,15 +2990,6 @@ trigger_monday_pulse()
 if 'groq_key' not in st.session_state:
     st.session_state.groq_key = get_void_secret("GROQ_API_KEY", "RESTRICTED")
 
-# 2. Initialize Client safely
-if st.session_state.groq_key != "RESTRICTED":
-    try:
-        client = Groq(api_key=st.session_state.groq_key)
-    except Exception:
-        client = None
-else:
-    client = None
-
 MODEL_ID = "llama-3.3-70b-versatile"
 
 # --- 2. VISUAL FORGE (FREE IMAGE ENGINE) ---
@@ -1010,7 +3072,7 @@ def show_upgrade_authority():
                     "category": "REEL_SUBMISSION"
                 }
                 try:
-                    res = requests.post(st.secrets["REEL_API_URL"], json=r_payload, timeout=10)
+                    res = webhook_post(st.secrets["REEL_API_URL"], "REEL_SUBMISSION", json=r_payload, timeout=10)
                     if "success" in res.text.lower():
                         st.success("✅ REEL LOGGED: The Director will verify your link shortly.")
                         st.session_state['reel_verified'] = True
@@ -1103,7 +3165,7 @@ def show_upgrade_authority():
                     }
                     try:
                         target_api = st.secrets["VERIFICATION_API_URL"]
-                        response = requests.post(target_api, json=f_payload, timeout=15)
+                        response = webhook_post(target_api, "PAYMENT_VERIFY", json=f_payload, timeout=15)
 
                         # MODIFIED: More robust check for 'success' in response
                         if response.status_code == 200 and "success" in response.text.lower():
@@ -1155,10 +3217,98 @@ ELITE_CIPHERS = {
     get_void_secret("CIPHER_3", "VOID-Z"): "Elite Pioneer",
 }
 
+# --- 🔑 USER DIRECTORY (O(1) LOGIN LOOKUP) ---
+# Process-wide map of normalized email -> {passkey hash -> member record}, with the
+# tier already resolved through TIER_MAP. It follows the shared user sheet
+# incrementally: only rows that were added or changed since the last sync are touched.
+# A login miss may force one live re-download per MEMBER_REVALIDATE_SECONDS per
+# process; other misses in that window fail straight from the directory.
+MEMBER_REVALIDATE_SECONDS = 30
+
+def _passkey_hash(passkey):
+    return hashlib.sha256(str(passkey).encode()).hexdigest()
+
+class UserDirectory:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._members = {}
+        self._rows = set()
+        self._source = None
+        self._revalidated_at = float("-inf")
+
+    def claim_revalidation(self):
+        """True for at most one caller per MEMBER_REVALIDATE_SECONDS."""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._revalidated_at < MEMBER_REVALIDATE_SECONDS:
+                return False
+            self._revalidated_at = now
+            return True
+
+    def sync(self, users_df, tier_map):
+        if users_df is self._source or users_df.empty or 'Email' not in users_df.columns:
+            return
+        frame = users_df.reindex(columns=['Email', 'Password', 'Name', 'Status'])
+        ordered = list(zip(
+            frame['Email'].astype(str).str.strip().str.lower(),
+            frame['Password'].astype(str),
+            frame['Name'].fillna('').astype(str),
+            frame['Status'].fillna('Free').astype(str).str.strip(),
+        ))
+        rows = set(ordered)
+        # Rebuild every email the diff touches from its current rows, so duplicate
+        # rows never strand a login and the first sheet row per passkey still wins
+        touched = {row[0] for row in self._rows ^ rows}
+        rebuilt = {email: {} for email in touched}
+        for email, passkey, name, status in ordered:
+            if email in rebuilt:
+                rebuilt[email].setdefault(_passkey_hash(passkey), {
+                    "name": name,
+                    "status": tier_map.get(status, "Free"),
+                })
+        with self._lock:
+            for email, records in rebuilt.items():
+                if records:
+                    self._members[email] = records
+                else:
+                    self._members.pop(email, None)
+            self._rows = rows
+            self._source = users_df
+
+    def lookup(self, email, passkey):
+        with self._lock:
+            record = self._members.get(email.strip().lower(), {}).get(_passkey_hash(passkey))
+            return dict(record) if record else None
+
+@st.cache_resource
+def get_user_directory():
+    return UserDirectory()
+
+def warm_user_directory(fresh=False):
+    get_user_directory().sync(load_user_db(fresh=fresh), TIER_MAP)
+
+def find_member(email, passkey):
+    """Resolves a login against the directory; a miss may re-check the live sheet (rate-limited)."""
+    directory = get_user_directory()
+    warm_user_directory()
+    record = directory.lookup(email, passkey)
+    if record is None and directory.claim_revalidation():
+        # Cached copy may predate a fresh registration; confirm against the live sheet
+        warm_user_directory(fresh=True)
+        record = directory.lookup(email, passkey)
+    return record
+
 if not st.session_state.logged_in:
     st.markdown("<h1 style='text-align: center; color: #00d4ff; letter-spacing: 5px;'>VOID OS</h1>", unsafe_allow_html=True)
     st.markdown("<p style='text-align: center; color: #888; font-size: 0.8em;'>INTELLIGENCE ACCESS PROTOCOL v4.0</p>", unsafe_allow_html=True)
     
+    # Warm the user directory on a worker while the intro plays in the browser
+    if not st.session_state.get('boot_prefetch_started'):
+        get_boot_executor().submit(warm_user_directory)
+        if MARKET_PULSE_URL != "RESTRICTED":
+            get_market_service(MARKET_PULSE_URL)  # Starts the pulse thread before any page needs it
+        st.session_state.boot_prefetch_started = True
+
     t1, t2, t3 = st.tabs(["🔑 LOGIN", "🛡️ IDENTITY INITIALIZATION", "🛰️ ELITE UPLINK"])
     
     # --- TAB 1: LOGIN ---
@@ -1167,8 +3317,6 @@ if not st.session_state.logged_in:
         pw_in = st.text_input("PASSKEY", type="password", key="gate_login_pw")
         
         if st.button("INITIATE UPLINK", use_container_width=True):
-            users = load_user_db() 
-            
             # Secure Admin Check
             adm_user = get_void_secret("GATEKEEPER_ADMIN_USER", "RESTRICTED")
             adm_pw = get_void_secret("GATEKEEPER_ADMIN_PW", "RESTRICTED")
@@ -1182,17 +3330,14 @@ if not st.session_state.logged_in:
                     "user_email": "admin"
                 })
                 st.rerun()
-            elif not users.empty:
-                match = users[(users['Email'].astype(str).str.lower() == email_in) & (users['Password'].astype(str) == pw_in)]
-                if not match.empty:
-                    raw_status = match.iloc[0]['Status']
-                    resolved_status = TIER_MAP.get(raw_status, "Free")
-                    
+            else:
+                member = find_member(email_in, pw_in)
+                if member:
                     st.session_state.update({
                         "logged_in": True, 
-                        "user_name": match.iloc[0]['Name'], 
+                        "user_name": member['name'], 
                         "user_email": email_in, 
-                        "user_status": resolved_status
+                        "user_status": member['status']
                     })
                     st.rerun()
                 else:
@@ -1209,7 +3354,7 @@ if not st.session_state.logged_in:
                 if st.button("OVERRIDE VIA SECURITY"):
                     payload = {"email": r_email, "action": "SECURE_RESET", "answer": s_ans, "message": new_p}
                     try:
-                        res = requests.post(NEW_URL, json=payload, timeout=15)
+                        res = webhook_post(NEW_URL, "SECURE_RESET", json=payload, timeout=15)
                         if "SUCCESS" in res.text: st.success("IDENTITY VERIFIED. PASSKEY UPDATED.")
                         else: st.error(f"UPLINK DENIED: {res.text}")
                     except Exception as e: st.error(f"CRASH: {e}")
@@ -1218,7 +3363,7 @@ if not st.session_state.logged_in:
                 if not st.session_state.rec_otp_sent:
                     if st.button("SEND RECOVERY OTP"):
                         try:
-                            response = requests.post(NEW_URL, json={"category": "SEND_OTP", "email": r_email}, timeout=15)
+                            response = webhook_post(NEW_URL, "SEND_OTP", json={"category": "SEND_OTP", "email": r_email}, timeout=15)
                             if response.status_code == 200 and len(response.text.strip()) == 6:
                                 st.session_state.generated_otp = response.text.strip()
                                 st.session_state.rec_otp_sent = True
@@ -1235,7 +3380,7 @@ if not st.session_state.logged_in:
                         if rec_otp_in == st.session_state.generated_otp:
                             payload = {"email": r_email, "action": "SECURE_RESET", "message": new_p_otp, "bypass": "true"}
                             try:
-                                res = requests.post(NEW_URL, json=payload, timeout=15)
+                                res = webhook_post(NEW_URL, "SECURE_RESET", json=payload, timeout=15)
                                 if "SUCCESS" in res.text:
                                     st.success("VAULT UPDATED. YOU MAY NOW LOGIN.")
                                     st.session_state.rec_otp_sent = False
@@ -1284,7 +3429,7 @@ if not st.session_state.logged_in:
                     with st.spinner("Transmitting OTP..."):
                         payload = {"category": "SEND_OTP", "email": e.strip().lower(), "channel": "Email"}
                         try:
-                            response = requests.post(NEW_URL, json=payload, timeout=15)
+                            response = webhook_post(NEW_URL, "SEND_OTP", json=payload, timeout=15)
                             if response.status_code == 200 and len(response.text.strip()) == 6:
                                 st.session_state.generated_otp = response.text.strip()
                                 st.session_state.otp_sent = True
@@ -1305,7 +3450,7 @@ if not st.session_state.logged_in:
                 if user_otp == st.session_state.generated_otp:
                     final_payload = {"category": "REGISTRATION", "data": st.session_state.temp_reg_data}
                     try:
-                        r = requests.post(NEW_URL, json=final_payload, timeout=20)
+                        r = webhook_post(NEW_URL, "REGISTRATION", json=final_payload, timeout=20)
                         if "SUCCESS" in r.text:
                             st.success("✅ IDENTITY SECURED. YOU MAY NOW LOGIN.")
                             st.balloons() 
@@ -1332,8 +3477,21 @@ if not st.session_state.logged_in:
                 })
                 st.rerun()
             else: st.error("INVALID CIPHER.")
+    record_time_to_interactive()
     st.stop()
 
+# --- ENGINE BINDING (post-gate) ---
+try:
+    groq_c = get_llm_client("groq")
+except Exception:
+    groq_c = None
+
+# Paid tiers jump the shared provider queues; free nodes share what is left fairly
+get_rate_limiter().identity.set((
+    st.session_state.get('user_email', 'unknown'),
+    0 if str(st.session_state.get('user_status', 'Free')) != "Free" else 1,
+))
+
 # 1. INITIALIZE PAGE STATE (Prevents NameError)
 if 'page' not in st.session_state:
     st.session_state.page = "🏠 Dashboard"
@@ -1411,6 +3569,8 @@ with st.sidebar:
             chat_msg_container = st.container()
             if "manager_chat" not in st.session_state:
                 st.session_state.manager_chat = []
+            if "manager_memory" not in st.session_state:
+                st.session_state.manager_memory = {"summary": "", "folded": 0}
 
             with chat_msg_container:
                 for msg in st.session_state.manager_chat:
@@ -1439,10 +3599,19 @@ with st.sidebar:
                                 # --- SOVEREIGN CONSCIOUSNESS PROTOCOL ---
                                 user_name = st.session_state.get('user_name', 'DIRECTOR')
                                 user_tier = st.session_state.get('user_status', 'Free')
+
+                                # --- ROLLING MEMORY: land the previous background fold first ---
+                                memory = st.session_state.manager_memory
+                                pending_fold = st.session_state.pop('manager_memory_fold', None)
+                                if pending_fold is not None:
+                                    try:
+                                        memory["summary"], memory["folded"] = pending_fold.result(timeout=10)
+                                    except Exception:
+                                        pass  # Keep the last summary; the turns stay unfolded and are retried
                                 
-                                stream = groq_c.chat.completions.create(
-                                    model="llama-3.3-70b-versatile",
-                                    messages=[
+                                full_resp = llm_stream(
+                                    "chat",
+                                    [
                                         {
                                             "role": "system", 
                                             "content": f"""
@@ -1459,17 +3628,18 @@ with st.sidebar:
                                             [OBJECTIVE]: Be the Director's high-level consultant, not their search box.
                                             """
                                         },
-                                        {"role": "user", "content": agent_input}
+                                        *build_chat_context(st.session_state.manager_chat, memory["summary"], memory["folded"]),
                                     ],
-                                    stream=True
+                                    placeholder=resp_container, cache=False
                                 )
-                                for chunk in stream:
-                                    if chunk.choices[0].delta.content:
-                                        full_resp += chunk.choices[0].delta.content
-                                        resp_container.markdown(full_resp + "▌")
-                                
-                                resp_container.markdown(full_resp)
                                 st.session_state.manager_chat.append({"role": "assistant", "content": full_resp})
+
+                                history = st.session_state.manager_chat
+                                fold_upto = len(history) - CHAT_MEMORY_MESSAGES
+                                if fold_upto > memory["folded"]:
+                                    st.session_state.manager_memory_fold = get_llm_bulk_executor().submit(
+                                        fold_chat_memory, memory["summary"], history[memory["folded"]:fold_upto], fold_upto
+                                    )
                             except Exception as e:
                                 st.error(f"Uplink Error: {str(e)}")
                         else:
@@ -1489,7 +3659,7 @@ with st.sidebar:
                                 "message": str(feedback_txt),
                                 "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                             }
-                            response = requests.post(api_url, json=payload, timeout=10)
+                            response = webhook_post(api_url, "FEEDBACK", json=payload, timeout=10)
                             if response.status_code == 200:
                                 st.success("TRANSMISSION SUCCESSFUL.")
                                 st.session_state.show_feedback_box = False
@@ -1501,6 +3671,10 @@ with st.sidebar:
                     else:
                         st.warning("Feedback field is void.")
 
+        uplink_depth = sum(get_rate_limiter().depth().values())
+        if uplink_depth:
+            st.caption(f"🚦 UPLINK QUEUE: {uplink_depth} request(s) waiting on provider quota")
+
         # --- 🛠️ GLOBAL ACTIONS ---
         st.divider()
         if st.button("💬 SYSTEM FEEDBACK", use_container_width=True):
@@ -1509,6 +3683,9 @@ with st.sidebar:
 
         if st.button("🔄 RE-CALIBRATE", use_container_width=True):
             st.cache_data.clear()
+            get_sheet_cache().clear()
+            if MARKET_PULSE_URL != "RESTRICTED":
+                get_market_service(MARKET_PULSE_URL).refresh_now()
             st.rerun()
 
         if st.button("🚪 TERMINATE SESSION", use_container_width=True):
@@ -1578,12 +3755,13 @@ if page == "🏗️ Script Architect":
                         
                         try:
                             # Logic Intact: Using Groq Client initialized at top of script
-                            res = groq_c.chat.completions.create(
-                                model="llama-3.1-8b-instant", 
-                                messages=[{"role": "user", "content": formation_prompt}]
+                            generated_script = llm_stream(
+                                "script",
+                                [{"role": "user", "content": formation_prompt}],
+                                placeholder=c2.empty(), cache=False
                             )
-                            generated_script = res.choices[0].message.content
                             st.session_state.current_architect_txt = generated_script
+                            archive_script(platform, topic, generated_script, f"Vigor: {tone}")
                             
                             st.session_state.daily_usage_map[user_email] += 1
                             
@@ -1598,7 +3776,7 @@ if page == "🏗️ Script Architect":
                             
                             # Only attempt transmission if API_URL is valid
                             if API_URL != "RESTRICTED":
-                                requests.post(API_URL, json=payload, timeout=5)
+                                webhook_post(API_URL, "SAVE_SCRIPT", json=payload, timeout=5)
                                 st.toast("⚡ ARCHIVE SYNCHRONIZED", icon="✅")
                             
                             st.rerun()
@@ -1636,12 +3814,13 @@ elif page == "🏠 Dashboard":
     
     # 1. THE AGGREGATED INTELLIGENCE ROW (KPIs)
     # We pull data from across the app states
+    ensure_user_tasks()
     total_tasks = len(st.session_state.get('tasks', []))
     signed_clients = len(st.session_state.tasks[st.session_state.tasks['Status'] == "✅ Signed"]) if total_tasks > 0 else 0
     
     kpi1, kpi2, kpi3, kpi4 = st.columns(4)
     with kpi1:
-        st.metric("FORGED SCRIPTS", len(st.session_state.get('script_history', [])))
+        st.metric("FORGED SCRIPTS", get_void_store().count(st.session_state.get('user_email'), "script"))
     with kpi2:
         st.metric("PIPELINE SIZE", total_tasks)
     with kpi3:
@@ -1731,15 +3910,22 @@ elif page == "📡 My Growth Hub":
                             st.info("### 🌑 VOID v2.0: THE SHADOW UPDATE")
                             st.warning("Instagram Sync coming in v2.0. Use **Manual Override**.")
                         else:
-                            with st.spinner("Decoding Meta-Streams..."):
-                                try:
-                                    subs, views = get_live_stats(target_url) 
-                                    if subs:
-                                        st.session_state.current_count = subs
-                                        st.session_state.total_views = views
-                                        st.success(f"Uplink Established: {subs:,} detected.")
-                                except NameError:
-                                    st.error("Scraper Module Offline.")
+                            # One batch: the target plus every linked profile, resolved on the extraction pool
+                            linked = [u for k, u in st.session_state.user_profiles.items() if k in ("youtube", "instagram", "x") and u]
+                            st.session_state.stats_sync = {
+                                "target": target_url,
+                                "futures": get_stats_service().submit_many([target_url, *linked]),
+                                "deadline": time.monotonic() + YTDLP_DEADLINE_SECONDS,
+                            }
+
+                if st.session_state.get('stats_sync'):
+                    stats_sync_monitor()
+                if st.session_state.get('stats_sync_notice'):
+                    kind, notice = st.session_state.pop('stats_sync_notice')
+                    getattr(st, kind)(notice)
+                if st.session_state.get('profile_stats'):
+                    for url, r in st.session_state.profile_stats.items():
+                        st.caption(f"📈 {url} // {r['subs'] or '—'} followers | {r['views'] or '—'} views | as of {r['as_of']}")
 
             with col_manual:
                 show_override = st.toggle("Manual Override", key="pro_tier_manual_toggle")
@@ -1785,8 +3971,7 @@ elif page == "📡 My Growth Hub":
     st.subheader("🗓️ TASK FORGE COMMAND")
     # ... [Keep your existing Task Forge code here]
     
-    if 'tasks' not in st.session_state:
-        st.session_state.tasks = pd.DataFrame(columns=["Task", "Node", "Status", "Deadline"])
+    ensure_user_tasks()
 
     with st.expander("➕ FORGE NEW CONTENT TASK"):
         with st.form("task_form_hub_master", clear_on_submit=True):
@@ -1796,6 +3981,7 @@ elif page == "📡 My Growth Hub":
             if st.form_submit_button("SYNC TO FORGE") and t_name:
                 new_task = pd.DataFrame([{"Task": t_name, "Node": t_plat, "Status": "⏳ Pending", "Deadline": t_date.strftime("%Y-%m-%d")}])
                 st.session_state.tasks = pd.concat([st.session_state.tasks, new_task], ignore_index=True)
+                save_user_tasks()
                 st.rerun()
 
     if not st.session_state.tasks.empty:
@@ -1804,7 +3990,7 @@ elif page == "📡 My Growth Hub":
         st.write(f"**Campaign Completion: {int((done/total)*100)}%**")
         st.progress(done/total)
 
-        st.session_state.tasks = st.data_editor(
+        edited_tasks = st.data_editor(
             st.session_state.tasks,
             use_container_width=True,
             num_rows="dynamic",
@@ -1814,6 +4000,9 @@ elif page == "📡 My Growth Hub":
                 "Node": st.column_config.SelectboxColumn("Node", options=["YouTube", "Instagram", "X", "TikTok"], required=True)
             }
         )
+        if not edited_tasks.equals(st.session_state.tasks):
+            st.session_state.tasks = edited_tasks
+            save_user_tasks()
 
 elif page == "🌐 Global Pulse":
     draw_title("🌐", "GLOBAL INTELLIGENCE PULSE")
@@ -1826,25 +4015,35 @@ elif page == "🌐 Global Pulse":
         st.error("🔑 API KEY MISSING: Add 'NEWS_API_KEY' to your Streamlit Secrets.")
         NEWS_API_KEY = None
 
+    PULSE_SOURCE_DEADLINE = 7  # seconds per fanned-out source
+
     # 1. TRIGGER DATA UPLINK
-    df_pulse = fetch_live_market_data()
+    pulse_snapshot = get_market_snapshot()
+    df_pulse = pulse_snapshot.df
 
     if not df_pulse.empty:
+        st.caption(f"🛰️ MARKET SNAPSHOT v{pulse_snapshot.version} // synced {int(time.time() - pulse_snapshot.fetched_at)}s ago")
         # --- 2. SEARCH TERMINAL ---
         search_query = st.text_input("🔍 Intercept Keyword...", placeholder="Search niches...", label_visibility="collapsed")
 
         # --- 3. PERFORMANCE VECTORS ---
         st.subheader("📊 TOP 10 PERFORMANCE VECTORS")
-        display_df = df_pulse.copy()
-        
-        vel_col = 'growth' if 'growth' in display_df.columns else display_df.columns[2]
-        name_col = 'niche name' if 'niche name' in display_df.columns else display_df.columns[0]
-
-        display_df = display_df.sort_values(by=vel_col, ascending=False).head(10)
+        vel_col, name_col = 'growth', 'niche name'
+        display_df = df_pulse.nlargest(10, vel_col)
         
         if search_query:
             display_df = display_df[display_df.astype(str).apply(lambda x: x.str.contains(search_query, case=False)).any(axis=1)]
 
+        # Fan out the news sources now so they load while the table and radar render.
+        # The fallback feed is fetched speculatively; each source has its own deadline.
+        # We clean the topic name to ensure the API understands it
+        news_topic = search_query if search_query else (display_df[name_col].iloc[0] if not display_df.empty else "AI Technology")
+        if NEWS_API_KEY:
+            fanout = get_fanout_executor()
+            news_deadline = time.monotonic() + PULSE_SOURCE_DEADLINE
+            news_primary = fanout.submit(fetch_live_news, news_topic, NEWS_API_KEY)
+            news_fallback = fanout.submit(fetch_live_news, "AI Tech Trends", NEWS_API_KEY)
+
         st.data_editor(
             display_df,
             column_config={
@@ -1866,11 +4065,9 @@ elif page == "🌐 Global Pulse":
                     f"identify 3 high-velocity 'Trend Clusters' currently exploding. "
                     f"For each: 1. A catchy title, 2. The 'Secret Hook', and 3. A Virality Heatmap score (1-100)."
                 )
-                pulse_res = groq_c.chat.completions.create(
-                    model="llama-3.3-70b-versatile",
-                    messages=[{"role": "user", "content": pulse_prompt}]
+                st.session_state.radar_intel = llm_complete(
+                    "strategy", [{"role": "user", "content": pulse_prompt}]
                 )
-                st.session_state.radar_intel = pulse_res.choices[0].message.content
         
         if st.session_state.get('radar_intel'):
             with st.container(border=True):
@@ -1882,16 +4079,14 @@ elif page == "🌐 Global Pulse":
         # --- 4. LIVE WORLD INTELLIGENCE ---
         st.subheader("📰 LIVE WORLD INTELLIGENCE")
         
-        # We clean the topic name to ensure the API understands it
-        news_topic = search_query if search_query else (display_df[name_col].iloc[0] if not display_df.empty else "AI Technology")
-        
         if NEWS_API_KEY:
-            articles = fetch_live_news(news_topic, NEWS_API_KEY)
+            with st.spinner("📡 INTERCEPTING WORLD FEEDS..."):
+                articles = collect_source(news_primary, news_deadline, fallback=[])
 
-            # BAILOUT LOGIC: If no specific news, fetch general tech news
-            if not articles:
-                st.write(f"🛰️ Specific intel for '{news_topic}' is sparse. Expanding search radius...")
-                articles = fetch_live_news("AI Tech Trends", NEWS_API_KEY)
+                # BAILOUT LOGIC: If no specific news, use the general tech feed already in flight
+                if not articles:
+                    st.write(f"🛰️ Specific intel for '{news_topic}' is sparse. Expanding search radius...")
+                    articles = collect_source(news_fallback, news_deadline, fallback=[])
 
             if articles:
                 for art in articles[:8]:
@@ -1927,14 +4122,16 @@ elif page == "⚔️ Trend Duel":
         # --- PHASE 1: INDIVIDUAL SECTOR AUDIT (Preserved Logic) ---
         st.subheader("🌑 Deep Vector Analysis")
         
-        target = st.selectbox("Select Niche to Audit", pulse_df['niche name'].unique())
-        row = pulse_df[pulse_df['niche name'] == target].iloc[0]
+        niche_names = pulse_df.index.tolist()
+        target = st.selectbox("Select Niche to Audit", niche_names)
+        row = pulse_df.loc[target]
         
         with st.container(border=True):
             col_a, col_b, col_c = st.columns(3)
-            col_a.metric(label="Intelligence Score", value=f"{row['score']}/100")
+            col_a.metric(label="Intelligence Score", value=f"{row['score']:g}/100")
             col_b.metric(label="Growth Velocity", value=f"{row['growth']}%")
             col_c.metric(label="Market Density", value=str(row['saturation']).upper())
+            st.caption(row['status'])
 
         st.info(f"**VECTOR ANALYSIS FOR {target.upper()}:**\n\n{row['reason']}")
         
@@ -1945,16 +4142,15 @@ elif page == "⚔️ Trend Duel":
         
         selections = st.multiselect(
             "Select Niches to Compare", 
-            options=pulse_df['niche name'].unique().tolist(), 
-            default=pulse_df['niche name'].unique().tolist()[:5]
+            options=niche_names, 
+            default=niche_names[:5]
         )
         
-        comparison_df = pulse_df[pulse_df['niche name'].isin(selections)]
+        comparison_df = pulse_df[pulse_df.index.isin(selections)]
         
         if not comparison_df.empty: 
             import plotly.express as px
             import plotly.graph_objects as go
-            from groq import Groq # Ensure you have 'groq' in requirements.txt
             
             fig = px.bar(
                 comparison_df, 
@@ -1972,7 +4168,7 @@ elif page == "⚔️ Trend Duel":
             st.plotly_chart(fig, use_container_width=True)
             
             st.dataframe(
-                comparison_df[['niche name', 'score', 'growth', 'saturation', 'reason']], 
+                comparison_df[['niche name', 'score', 'growth', 'saturation', 'status', 'reason']], 
                 hide_index=True, 
                 use_container_width=True
             )
@@ -1984,11 +4180,11 @@ elif page == "⚔️ Trend Duel":
             st.write("Triangulate the intersection of two market vectors to expose the Sovereign Gap.")
 
             q_col1, q_col2 = st.columns(2)
-            t_a_name = q_col1.selectbox("Vector Alpha", pulse_df['niche name'].unique(), index=0)
-            t_b_name = q_col2.selectbox("Vector Beta", pulse_df['niche name'].unique(), index=1)
+            t_a_name = q_col1.selectbox("Vector Alpha", niche_names, index=0)
+            t_b_name = q_col2.selectbox("Vector Beta", niche_names, index=1)
 
-            data_a = pulse_df[pulse_df['niche name'] == t_a_name].iloc[0]
-            data_b = pulse_df[pulse_df['niche name'] == t_b_name].iloc[0]
+            data_a = pulse_df.loc[t_a_name]
+            data_b = pulse_df.loc[t_b_name]
 
             # High-End Radar Mapping
             quantum_fig = go.Figure()
@@ -2036,8 +4232,8 @@ elif page == "⚔️ Trend Duel":
                 
                 if st.button("⚡ INITIALIZE NEURAL COLLISION"):
                     try:
-                        # Initialize Groq Client
-                        client = Groq(api_key=st.secrets["GROQ_API_KEY"])
+                        # Shared Groq Client
+                        client = get_llm_client("groq")
                         
                         with st.status("Performing Quantum Synthesis...", expanded=True) as status:
                             st.write("Triangulating Market Vectors...")
@@ -2058,12 +4254,7 @@ elif page == "⚔️ Trend Duel":
                             Format the output with professional headers and clear, aggressive strategic insights.
                             """
                             
-                            chat_completion = client.chat.completions.create(
-                                messages=[{"role": "user", "content": prompt}],
-                                model="llama-3.3-70b-versatile", # High-quality Groq model
-                            )
-                            
-                            report = chat_completion.choices[0].message.content
+                            report = llm_complete("strategy", [{"role": "user", "content": prompt}])
                             status.update(label="Collision Successful!", state="complete", expanded=False)
 
                         st.subheader("📋 SOVEREIGN COLLISION REPORT")
@@ -2086,11 +4277,9 @@ elif page == "🧠 Neural Forge":
     import random
     import datetime
     import requests  
-    import openai 
-    from groq import Groq
 
-    # Initialize Groq Client
-    groq_c = Groq(api_key=st.secrets["GROQ_API_KEY"])
+    # Shared Groq Client
+    groq_c = get_llm_client("groq")
 
     # 1. ACCESS CONTROL & LIMITS
     if not st.session_state.get('logged_in'):
@@ -2141,32 +4330,56 @@ elif page == "🧠 Neural Forge":
         elif remaining_credits <= 0:
             st.error("🚨 NEURAL EXHAUSTION: Daily limit reached.")
         else:
-            with st.spinner(f"🌑 ANCHORING {f_lang.upper()} NEURAL PATHWAYS..."):
-                try:
-                    dna_instruction = f"IDENTITY PROTOCOL: Strictly adhere to this Brand DNA: {brand_dna}" if vault_active else "Tone: High-authority, viral-engineered."
-                    
-                    sys_msg = (
-                        f"You are the VOID-CREATOR Strategic Engine. Generate a world-class production blueprint.\n"
-                        f"LANGUAGE: {f_lang} | PLATFORM: {f_platform}\n"
-                        f"TOPIC: {f_topic} | FRAMEWORK: {f_framework}\n"
-                        f"VISUAL VIBE: {f_colors} with {f_lighting} lighting.\n"
-                        f"{dna_instruction}\n\n"
-                        f"STRUCTURE YOUR RESPONSE INTO THESE 3 SECTIONS:\n"
-                        f"1. --- SCRIPT --- \n(Write a high-retention script. Include [SCENE START] tags and specify where the {f_interrupt} interrupt occurs. Pacing: {f_pacing}.)\n\n"
-                        f"2. --- IMAGE PROMPTS --- \n(Provide 3 hyper-realistic DALL-E 3 prompts for thumbnails using {f_colors}.)\n\n"
-                        f"3. --- VIDEO MANIFEST --- \n(Describe 3 cinematic 5-second shots for AI video generation.)"
-                    )
-                    
-                    res = groq_c.chat.completions.create(
-                        model="llama-3.3-70b-versatile",
-                        messages=[{"role": "system", "content": "You are an elite content architect."}, {"role": "user", "content": sys_msg}],
-                        temperature=0.3, # Slightly increased for better creative flow
-                        max_tokens=2500   
+            try:
+                # Ground the blueprint in the vault passages that actually match this topic;
+                # they replace the whole-vault DNA summary, which stays as the fallback
+                vault_hits = retrieve_vault_context(st.session_state.get('user_email'), f_topic)
+                if vault_hits:
+                    excerpts = "\n\n".join(f"[{name}] {text}" for _, name, text in vault_hits)
+                    dna_instruction = (
+                        f"IDENTITY PROTOCOL: Match the creator's voice in these excerpts from their own material, "
+                        f"most relevant to this topic; reuse their facts and phrasing:\n{excerpts}"
                     )
-                    st.session_state.pro_forge_txt = res.choices[0].message.content
-                    st.session_state.daily_usage += 1
-                except Exception as e:
-                    st.error(f"Synthesis Error: {e}")
+                elif vault_active:
+                    dna_instruction = f"IDENTITY PROTOCOL: Strictly adhere to this Brand DNA: {brand_dna}"
+                else:
+                    dna_instruction = "Tone: High-authority, viral-engineered."
+                
+                sys_msg = (
+                    f"You are the VOID-CREATOR Strategic Engine. Generate a world-class production blueprint.\n"
+                    f"LANGUAGE: {f_lang} | PLATFORM: {f_platform}\n"
+                    f"TOPIC: {f_topic} | FRAMEWORK: {f_framework}\n"
+                    f"VISUAL VIBE: {f_colors} with {f_lighting} lighting.\n"
+                    f"{dna_instruction}\n\n"
+                    f"STRUCTURE YOUR RESPONSE INTO THESE 3 SECTIONS:\n"
+                    f"1. --- SCRIPT --- \n(Write a high-retention script. Include [SCENE START] tags and specify where the {f_interrupt} interrupt occurs. Pacing: {f_pacing}.)\n\n"
+                    f"2. --- IMAGE PROMPTS --- \n(Provide 3 hyper-realistic DALL-E 3 prompts for thumbnails using {f_colors}.)\n\n"
+                    f"3. --- VIDEO MANIFEST --- \n(Describe 3 cinematic 5-second shots for AI video generation.)"
+                )
+                
+                submit_job(
+                    "forge", stream_job, "longform",
+                    [{"role": "system", "content": "You are an elite content architect."}, {"role": "user", "content": sys_msg}],
+                    2500,
+                    meta={"platform": f_platform, "topic": f_topic, "visual_dna": f"{', '.join(f_colors)} | {f_lighting}"},
+                    temperature=0.3, # Slightly increased for better creative flow
+                    max_tokens=2500   
+                )
+            except Exception as e:
+                st.error(f"Synthesis Error: {e}")
+
+    # Runs in the background job queue: survives navigation and is collected on return
+    forge_job = collect_job("forge", f"🌑 ANCHORING {f_lang.upper()} NEURAL PATHWAYS")
+    if forge_job is not None:
+        if forge_job.error is not None:
+            st.error(f"Synthesis Error: {forge_job.error}")
+        else:
+            st.session_state.pro_forge_txt = forge_job.result
+            st.session_state.pop('forge_audit', None)
+            st.session_state.pop('forge_visual_url', None)
+            st.session_state.pop('forge_audio', None)
+            st.session_state.daily_usage += 1
+            archive_script(forge_job.meta["platform"], forge_job.meta["topic"], forge_job.result, forge_job.meta["visual_dna"])
 
     # 4. REVEAL & PRODUCTION SUITE
     if st.session_state.get('pro_forge_txt'):
@@ -2183,24 +4396,33 @@ elif page == "🧠 Neural Forge":
                 if st.button("🔊 FORGE MASTER AUDIO", use_container_width=True):
                     if not v_id: st.error("❌ No Voice ID detected in session.")
                     else:
-                        with st.spinner("Synthesizing Elite Voiceover..."):
-                            script_content = st.session_state.pro_forge_txt.split("--- IMAGE PROMPTS ---")[0].replace("--- SCRIPT ---", "").strip()
-                            e_url = f"https://api.elevenlabs.io/v1/text-to-speech/{v_id}"
-                            headers = {"xi-api-key": st.secrets["ELEVENLABS_API_KEY"], "Content-Type": "application/json"}
-                            audio_res = requests.post(e_url, json={"text": script_content, "model_id": "eleven_multilingual_v2", "voice_settings": {"stability": 0.5, "similarity_boost": 0.8}}, headers=headers)
-                            if audio_res.status_code == 200: st.audio(audio_res.content)
-                            else: st.error(f"Audio Error: {audio_res.text}")
+                        script_content = st.session_state.pro_forge_txt.split("--- IMAGE PROMPTS ---")[0].replace("--- SCRIPT ---", "").strip()
+                        submit_job("forge_audio", forge_audio_job, v_id, script_content, st.secrets["ELEVENLABS_API_KEY"])
+                forge_audio = collect_job("forge_audio", "Synthesizing Elite Voiceover")
+                if forge_audio is not None:
+                    if forge_audio.error is not None:
+                        st.error(f"Audio Error: {forge_audio.error}")
+                    else:
+                        st.session_state.forge_audio = forge_audio.result
+                if st.session_state.get('forge_audio'):
+                    st.audio(st.session_state.forge_audio)
 
             with prod_col2:
                 if st.button("🎨 MANIFEST CTR VISUALS", use_container_width=True):
-                    with st.spinner("Generating Neural Visuals..."):
-                        client_ai = openai.OpenAI(api_key=st.secrets["OPENAI_API_KEY"])
-                        try:
-                            # Extracting the first prompt from the output
-                            p_extract = st.session_state.pro_forge_txt.split("--- IMAGE PROMPTS ---")[1].split("---")[0].strip()
-                            img_res = client_ai.images.generate(model="dall-e-3", prompt=f"{p_extract}. 8k resolution, cinematic lighting, ultra-detailed.", n=1, size="1024x1024")
-                            st.image(img_res.data[0].url, caption="Generated Sovereign Visual")
-                        except: st.error("Visual Synthesis Failed. Check API limits.")
+                    client_ai = get_llm_client("openai")
+                    try:
+                        # Extracting the first prompt from the output
+                        p_extract = st.session_state.pro_forge_txt.split("--- IMAGE PROMPTS ---")[1].split("---")[0].strip()
+                        submit_job("forge_visual", image_job, client_ai, f"{p_extract}. 8k resolution, cinematic lighting, ultra-detailed.")
+                    except: st.error("Visual Synthesis Failed. Check API limits.")
+                visual_job = collect_job("forge_visual", "Generating Neural Visuals")
+                if visual_job is not None:
+                    if visual_job.error is not None:
+                        st.error("Visual Synthesis Failed. Check API limits.")
+                    else:
+                        st.session_state.forge_visual_url = visual_job.result
+                if st.session_state.get('forge_visual_url'):
+                    st.image(st.session_state.forge_visual_url, caption="Generated Sovereign Visual")
 
             with prod_col3:
                 if st.button("🎥 TEXT-TO-VIDEO MANIFEST", use_container_width=True):
@@ -2212,25 +4434,31 @@ elif page == "🧠 Neural Forge":
         # --- AUDIT SUITE ---
         st.divider()
         st.subheader("🧪 VOID Intelligence Audit")
-        t_col1, t_col2 = st.columns(2)
-        with t_col1:
-            if st.button("🚀 SCORE VIRALITY & CTR"):
-                v_res = groq_c.chat.completions.create(model="llama-3.3-70b-versatile", messages=[{"role": "user", "content": f"Critique the virality of this script on a scale of 1-100 and give 3 improvements: {st.session_state.pro_forge_txt[:800]}"}])
-                st.info(v_res.choices[0].message.content)
-        with t_col2:
-            if st.button("🧠 NEURAL RETENTION MAP"):
-                r_res = groq_c.chat.completions.create(model="llama-3.3-70b-versatile", messages=[{"role": "user", "content": f"Analyze the retention triggers and pattern interrupts in this script: {st.session_state.pro_forge_txt[:800]}"}])
-                st.warning(r_res.choices[0].message.content)
+        run_audit = st.button("🚀 RUN FULL AUDIT (VIRALITY & RETENTION)", use_container_width=True)
+        forge_audit = st.session_state.get('forge_audit')
+        if run_audit or forge_audit:
+            t_col1, t_col2 = st.columns(2)
+            t_col1.markdown("**🚀 VIRALITY & CTR**")
+            t_col2.markdown("**🧠 NEURAL RETENTION MAP**")
+            # Both analyses stream side by side into their own column
+            audit_slots = {"virality": (t_col1.empty(), "info"), "retention": (t_col2.empty(), "warning")}
+            if run_audit:
+                try:
+                    st.session_state.forge_audit = audit_script(st.session_state.pro_forge_txt, audit_slots)
+                except Exception as e:
+                    st.error(f"Audit Error: {e}")
+            else:
+                for name, (slot, render) in audit_slots.items():
+                    getattr(slot, render)(forge_audit[name])
 
 
 # --- MODULE 8: VOID-RADIO (GPT-4 SOVEREIGN UPGRADE) ---
 elif page == "🎙️ VOID Radio":
     import re
     import requests
-    import openai
 
-    # Initialize OpenAI Client (Ensure OPENAI_API_KEY is in secrets)
-    client = openai.OpenAI(api_key=st.secrets["OPENAI_API_KEY"])
+    # Shared OpenAI Client (Ensure OPENAI_API_KEY is in secrets)
+    client = get_llm_client("openai")
 
     draw_title("🎙️", "VOID-RADIO || GPT-4 DIALECTIC")
     
@@ -2281,17 +4509,17 @@ elif page == "🎙️ VOID Radio":
 
     # 3. GPT-4 DYNAMIC SCRIPTING LOGIC
     if start_radio:
-        with st.spinner("🌑 GPT-4 NEURAL MAPPING IN PROGRESS..."):
-            # 3a. Context Extraction
-            context_data = ""
-            if uploaded_docs:
-                for doc in uploaded_docs:
-                    context_data += doc.read().decode("utf-8")[:12000] # GPT-4o supports high context
-            else:
-                context_data = st.session_state.get('brand_dna_summary', "Standard VOID-OS Strategic Protocol")
+        # 3a. Context Extraction (condensed inside the job; uploads are read here)
+        radio_sources = [(doc.name, doc.read().decode("utf-8")) for doc in uploaded_docs] if uploaded_docs else []
+        radio_brief = (
+            f"Build a research brief for a two-host podcast on: {pod_topic or 'the core ideas in these sources'}. "
+            f"Capture the key arguments, evidence, tensions and quotable lines."
+        )
+        radio_fallback = st.session_state.get('brand_dna_summary', "Standard VOID-OS Strategic Protocol")
 
-            # 3b. The Sovereign Dialectic Prompt
-            radio_prompt = (
+        # 3b. The Sovereign Dialectic Prompt
+        def build_radio_prompt(context_data):
+            return (
                 f"You are the VOID-RADIO Scripting Engine. Create a deep-dive, human-level conversation between {h_a_name} and {h_b_name}.\n"
                 f"CONTEXT DATA: {context_data}\n"
                 f"TOPIC: {pod_topic}\n"
@@ -2304,18 +4532,20 @@ elif page == "🎙️ VOID Radio":
                 f"4. Address the Director's interrupt directly if provided."
             )
 
-            try:
-                response = client.chat.completions.create(
-                    model="gpt-4o", # High reasoning for best dialectic
-                    messages=[{"role": "system", "content": "You are a world-class podcast producer and strategist."}, 
-                              {"role": "user", "content": radio_prompt}],
-                    temperature=0.85
-                )
-                st.session_state.radio_script = response.choices[0].message.content
-                st.session_state.void_credits -= 5.0 # Deduct for GPT-4 usage
-                st.success("✅ Neural Script Synthesized.")
-            except Exception as e:
-                st.error(f"GPT-4 Neural Error: {e}")
+        submit_job("radio_script", radio_script_job, radio_sources, radio_brief, radio_fallback, build_radio_prompt)
+
+    radio_job = collect_job("radio_script", "🌑 GPT-4 NEURAL MAPPING IN PROGRESS")
+    if radio_job is not None:
+        if radio_job.error is not None:
+            st.error(f"GPT-4 Neural Error: {radio_job.error}")
+        else:
+            st.session_state.radio_script = radio_job.result
+            st.session_state.pop('radio_audio', None)
+            st.session_state.pop('radio_art_url', None)
+            script_model = radio_job.meta.get("model", "")
+            # GPT-4 rate only when the dialectic was not failed over to llama
+            st.session_state.void_credits -= 5.0 if script_model.startswith("gpt-4") else 1.0
+            st.success(f"✅ Neural Script Synthesized. // ENGINE: {script_model or 'unknown'}")
 
     # 4. BROADCAST & AUDIO ENGINE
     if st.session_state.get('radio_script'):
@@ -2328,58 +4558,47 @@ elif page == "🎙️ VOID Radio":
         
         with a_col1:
             if st.button("🔊 GENERATE MASTER DUAL-VOICE AUDIO"):
-                with st.spinner("🌑 SEPARATING NEURAL CHANNELS..."):
-                    script = st.session_state.radio_script
-                    segments = re.split(r'(\[HOST [A|B]\]:)', script)
-                    
-                    combined_audio = b""
-                    v_a = st.secrets["ELEVENLABS_VOICE_ID_A"]
-                    v_b = st.secrets["ELEVENLABS_VOICE_ID_B"]
-                    api_key = st.secrets["ELEVENLABS_API_KEY"]
-
-                    valid_segments = [s for s in segments if s.strip()]
-                    for segment in valid_segments:
-                        if "[HOST A]" in segment:
-                            current_voice = v_a
-                            continue
-                        elif "[HOST B]" in segment:
-                            current_voice = v_b
-                            continue
-                        
-                        text = segment.replace(":", "").strip()
-                        if text and len(text) > 2:
-                            res = requests.post(
-                                f"https://api.elevenlabs.io/v1/text-to-speech/{current_voice}",
-                                json={"text": text, "model_id": "eleven_multilingual_v2", "voice_settings": {"stability": 0.4, "similarity_boost": 0.8}},
-                                headers={"xi-api-key": api_key, "Content-Type": "application/json"}
-                            )
-                            if res.status_code == 200: combined_audio += res.content
-
-                    if combined_audio:
-                        st.audio(combined_audio, format="audio/mp3")
-                        st.session_state.void_credits -= 2.0 # Deduct for ElevenLabs usage
-                        st.success("✅ BROADCAST MASTERED.")
+                v_a = st.secrets["ELEVENLABS_VOICE_ID_A"]
+                v_b = st.secrets["ELEVENLABS_VOICE_ID_B"]
+                api_key = st.secrets["ELEVENLABS_API_KEY"]
+                submit_job("radio_audio", dual_voice_audio_job, st.session_state.radio_script, v_a, v_b, api_key)
+
+            audio_job = collect_job("radio_audio", "🌑 SEPARATING NEURAL CHANNELS")
+            if audio_job is not None and audio_job.error is None and audio_job.result:
+                st.session_state.radio_audio = audio_job.result
+                st.session_state.void_credits -= 2.0 # Deduct for ElevenLabs usage
+                voiced, total = audio_job.meta.get("voiced", (0, 0))
+                if voiced < total:
+                    st.warning(f"⚠️ Voice quota ran out: {voiced}/{total} lines mastered.")
+                else:
+                    st.success("✅ BROADCAST MASTERED.")
+            elif audio_job is not None and audio_job.error is not None:
+                st.error(f"Audio Error: {audio_job.error}")
+            if st.session_state.get('radio_audio'):
+                st.audio(st.session_state.radio_audio, format="audio/mp3")
 
         with a_col2:
             if st.button("🎨 GENERATE BROADCAST ART (DALL-E 3)"):
-                with st.spinner("Visualizing Podcast Aesthetic..."):
-                    img_res = client.images.generate(
-                        model="dall-e-3",
-                        prompt=f"Cinematic podcast cover art, title '{pod_topic}', moody lighting, cyberpunk aesthetic, high detail.",
-                        size="1024x1024"
-                    )
-                    st.image(img_res.data[0].url, caption="Sovereign Broadcast Art")
-                    st.session_state.void_credits -= 3.0 # Deduct for DALL-E usage
+                submit_job("radio_art", image_job, client,
+                           f"Cinematic podcast cover art, title '{pod_topic}', moody lighting, cyberpunk aesthetic, high detail.")
+
+            art_job = collect_job("radio_art", "Visualizing Podcast Aesthetic")
+            if art_job is not None and art_job.error is None:
+                st.session_state.radio_art_url = art_job.result
+                st.session_state.void_credits -= 3.0 # Deduct for DALL-E usage
+            elif art_job is not None:
+                st.error(f"Visual Error: {art_job.error}")
+            if st.session_state.get('radio_art_url'):
+                st.image(st.session_state.radio_art_url, caption="Sovereign Broadcast Art")
 
 # --- MODULE 6: IDENTITY VAULT (THE SOVEREIGN BRAIN) ---
 elif page == "🔒 Identity Vault":
     import time
     import requests
     import streamlit as st
-    from groq import Groq
 
     # Initialize Clients from Secrets
-    client = Groq(api_key=st.secrets["GROQ_API_KEY"])
+    client = get_llm_client("groq")
     VAPI_KEY = st.secrets["VAPI_PRIVATE_KEY"]
     ELEVEN_LABS_KEY = st.secrets["ELEVEN_LABS_API_KEY"]
 
@@ -2415,26 +4634,25 @@ elif page == "🔒 Identity Vault":
     if st.button("🧬 SYNCHRONIZE DNA"):
         if uploaded_docs:
             with st.status("Analyzing Linguistic & Factual DNA...", expanded=True) as status:
-                all_text = ""
+                sources = []
                 for doc in uploaded_docs:
                     st.write(f"Reading: {doc.name}...")
                     try:
                         file_content = doc.read().decode("utf-8")
-                        all_text += f"\n--- SOURCE: {doc.name} ---\n{file_content}\n"
+                        sources.append((doc.name, file_content))
                         st.session_state.vault_inventory.append(doc.name)
                     except Exception as e:
                          st.error(f"Error reading {doc.name}: {e}")
                 
                 try:
-                    response = client.chat.completions.create(
-                        model="llama-3.3-70b-versatile",
-                        messages=[{
-                            "role": "system", 
-                            "content": "Analyze the text and extract a 'Brand DNA Profile'. Be sharp and concise."
-                        }, {"role": "user", "content": all_text[:4000]}],
-                        temperature=0.1
+                    map_progress = st.empty()
+                    st.session_state.brand_dna_summary = summarize_documents(
+                        sources,
+                        "Analyze the text and extract a 'Brand DNA Profile'. Be sharp and concise.",
+                        progress=lambda done, total: map_progress.write(f"Condensing source chunks: {done}/{total}"),
                     )
-                    st.session_state.brand_dna_summary = response.choices[0].message.content
+                    indexed = index_vault_sources(st.session_state.get('user_email'), sources)
+                    st.write(f"Indexed {indexed} retrieval chunks for the Neural Forge.")
                     status.update(label="✅ DNA ANCHORED", state="complete")
                     st.success("Sovereign Identity Updated.")
                 except Exception as e:
@@ -2529,6 +4747,7 @@ elif page == "🔒 Identity Vault":
             st.session_state.vault_inventory = []
             st.session_state.brand_dna_summary = "No DNA Synthesized yet."
             st.session_state.cloned_voice_id = "paula"
+            get_void_store().put_doc(st.session_state.get('user_email'), "vault_chunks", {})
             st.rerun()
 
 # --- MODULE 7: CLIENT PITCHER (PITCH ENGINE) ---
@@ -2557,9 +4776,10 @@ elif page == "💼 Client Pitcher":
             if groq_c and client_name and offer_details:
                 with st.spinner("🌑 CALCULATING PSYCHOLOGICAL HOOKS..."):
                     prompt = f"System: High-ticket closer. Target: {client_name} ({niche_cat}). Problem: {offer_details}. Write a minimalist ROI-focused cold DM. No emojis. No fluff."
-                    res = groq_c.chat.completions.create(model="llama-3.3-70b-versatile", messages=[{"role": "user", "content": prompt}])
-                    st.session_state.current_pitch = res.choices[0].message.content
-                    st.session_state.pitch_history.append({"client": client_name, "pitch": st.session_state.current_pitch, "timestamp": time.strftime("%H:%M")})
+                    st.session_state.current_pitch = llm_complete("strategy", [{"role": "user", "content": prompt}], cache=False)
+                    pitch_entry = {"client": client_name, "pitch": st.session_state.current_pitch, "timestamp": time.strftime("%H:%M")}
+                    st.session_state.pitch_history.append(pitch_entry)
+                    get_void_store().append(st.session_state.get('user_email'), "pitch", pitch_entry)
             else:
                 st.error("System Error: Missing Inputs or API Offline.")
 
@@ -2652,12 +4872,11 @@ elif page == "🧪 Creator Lab":
                     - Net Weekly Income (INR): ₹{net_inr:,.2f}
                     Task: Provide a 3-point 'Profit Blueprint' for this creator based on their NET income.
                     """
-                    res = groq_c.chat.completions.create(
-                        model="llama-3.3-70b-versatile", 
-                        messages=[{"role": "user", "content": roi_prompt}],
+                    st.session_state.roi_report = llm_complete(
+                        "strategy",
+                        [{"role": "user", "content": roi_prompt}],
                         temperature=0.5
                     )
-                    st.session_state.roi_report = res.choices[0].message.content
                 except Exception as e:
                     st.error(f"Uplink Error: {str(e)}")
 
@@ -2685,8 +4904,7 @@ elif page == "🧪 Creator Lab":
             if st.button("ANALYZE HOOK"):
                 with st.spinner("Neural Processing..."):
                     hook_prompt = f"Analyze this hook for viral potential: {user_hook}."
-                    res = groq_c.chat.completions.create(model="llama-3.3-70b-versatile", messages=[{"role": "user", "content": hook_prompt}])
-                    st.success(res.choices[0].message.content)
+                    st.success(llm_complete("classify", [{"role": "user", "content": hook_prompt}]))
 
         with tab_retention:
             st.subheader("Cognitive Retention Check")
@@ -2762,29 +4980,31 @@ elif page == "📜 History":
     # 🕵️ Search Filter
     search_query = st.text_input("🔍 Search Vault by Topic, Platform, or Script...", placeholder="Enter keyword...")
 
-    # Ensure histories exist in session state to avoid errors
-    if 'script_history' not in st.session_state: st.session_state.script_history = []
-    if 'pitch_history' not in st.session_state: st.session_state.pitch_history = []
+    # Archive is read page-by-page from the local store (newest first)
+    vault_store = get_void_store()
+    vault_email = st.session_state.get('user_email', 'unknown')
+    HISTORY_PAGE_SIZE = 10
 
-    if not st.session_state.script_history and not st.session_state.pitch_history:
+    def history_pager(kind, key):
+        total = vault_store.count(vault_email, kind, search_query)
+        pages = max(1, -(-total // HISTORY_PAGE_SIZE))
+        page_no = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, key=key) if pages > 1 else 1
+        return vault_store.page(vault_email, kind, HISTORY_PAGE_SIZE, (page_no - 1) * HISTORY_PAGE_SIZE, search_query)
+
+    if not vault_store.count(vault_email, "script") and not vault_store.count(vault_email, "pitch"):
         st.info("Vault is empty. Generate scripts in the Neural Forge to populate the archive.")
     else:
         t1, t2 = st.tabs(["💎 SCRIPT ARCHIVE", "💼 PITCH LOGS"])
         
         with t1:
-            # Filtering logic - Updated for the 8-column key names
-            # We check 'topic', 'platform', and 'Generated Script'
-            scripts = [
-                s for s in st.session_state.script_history 
-                if search_query.lower() in str(s.get('Topic', '')).lower() or 
-                   search_query.lower() in str(s.get('Platform', '')).lower() or
-                   search_query.lower() in str(s.get('Generated Script', s.get('script', ''))).lower()
-            ]
+            # Search is pushed down to the store; rows keep the 8-column key names
+            scripts = history_pager("script", "hist_script_page")
             
             if not scripts:
                 st.warning("No scripts matching that query.")
             
-            for i, s in enumerate(reversed(scripts)):
+            for s in scripts:
+                i = s['_id']
                 # Get values safely using .get() to support both old and new data formats
                 s_topic = s.get('Topic', s.get('topic', 'Untitled'))
                 s_platform = s.get('Platform', s.get('platform', 'Unknown'))
@@ -2797,7 +5017,7 @@ elif page == "📜 History":
                 # Visual Status Tag
                 status_tag = "✅ [FILMED]" if s_status == "filmed" else "⏳ [PENDING]"
                 
-                with st.expander(f"{status_tag} {s_platform} | {s_topic.upper()}"):
+                with st.expander(f"{status_tag} {s_platform} | {str(s_topic).upper()}"):
                     col_a, col_b = st.columns([3, 1])
                     
                     with col_a:
@@ -2815,8 +5035,9 @@ elif page == "📜 History":
                         # Interactive Status Toggle
                         if s_status != "filmed":
                             if st.button("🚀 MARK FILMED", key=f"film_{i}"):
-                                # Update locally
+                                # Update the local archive
                                 s['Status'] = "filmed"
+                                vault_store.update(i, s)
                                 # Note: To update GSheet status, you'd need a "UPDATE" branch in Apps Script
                                 st.toast("Status updated locally.")
                                 st.rerun()
@@ -2830,13 +5051,13 @@ elif page == "📜 History":
                         )
 
         with t2:
-            # Logic for pitches remains the same
-            pitches = [p for p in st.session_state.pitch_history if search_query.lower() in p.get('client', '').lower()]
+            pitches = history_pager("pitch", "hist_pitch_page")
             
             if not pitches:
                 st.warning("No pitches matching that query.")
 
-            for i, p in enumerate(reversed(pitches)):
+            for p in pitches:
+                i = p['_id']
                 with st.container(border=True):
                     col_p1, col_p2 = st.columns([4, 1])
                     with col_p1:
@@ -2884,6 +5105,55 @@ elif page == "🛡️ Admin Console":
         with col_m4:
             st.metric("System Health", "OPTIMAL", "Sync: 24ms")
 
+        pool_stats = get_llm_registry().stats()
+        st.caption(" | ".join(
+            f"🔌 {name.upper()} POOL // hits: {c['hits']} misses: {c['misses']} requests: {c['requests']}"
+            for name, c in pool_stats.items()
+        ))
+
+        router_stats = get_model_router().stats()
+        if router_stats:
+            with st.expander("🧭 MODEL ROUTER HEALTH"):
+                st.dataframe(pd.DataFrame.from_dict(router_stats, orient="index"), use_container_width=True)
+
+        flight_stats = get_single_flight().stats()
+        st.caption(f"🪢 SINGLE-FLIGHT // leaders: {flight_stats['leaders']} | joined: {flight_stats['joined']} | "
+                   f"in flight: {flight_stats['in_flight']}")
+
+        limiter_stats = get_rate_limiter().stats()
+        queue_depth = get_rate_limiter().depth()
+        st.caption(f"🚦 RATE LIMITER // granted: {limiter_stats['granted']} | timeouts: {limiter_stats['timeouts']} | "
+                   f"waited: {limiter_stats['waited_seconds']:.1f}s | queued: "
+                   + (", ".join(f"{k}={v}" for k, v in queue_depth.items()) or "0"))
+
+        job_stats = get_job_queue().stats()
+        st.caption(f"🏭 JOB QUEUE // queued: {job_stats['queued']} | running: {job_stats['running']} | "
+                   f"done: {job_stats['done']} | failed: {job_stats['failed']} | workers: {JOB_WORKERS}")
+
+        llm_cache_stats = get_llm_cache().stats()
+        st.caption(f"🧊 LLM CACHE // hit ratio: {llm_cache_stats['hit_ratio']:.0%} "
+                   f"({llm_cache_stats['hits']}/{llm_cache_stats['hits'] + llm_cache_stats['misses']}) | "
+                   f"entries: {llm_cache_stats['entries']} | latency saved: {llm_cache_stats['saved_seconds']:.1f}s")
+
+        media_stats = get_media_cache().stats()
+        st.caption(f"💾 MEDIA CACHE // files: {media_stats['files']} | "
+                   f"{media_stats['bytes'] / 1048576:.0f}/{MEDIA_CACHE_BUDGET_BYTES / 1048576:.0f} MB | "
+                   f"hits: {media_stats['hits']} | downloads: {media_stats['downloads']} | evicted: {media_stats['evictions']}")
+
+        stream_stats = get_stream_url_cache().stats()
+        st.caption(f"🔗 UPLINK URL CACHE // entries: {stream_stats['entries']} | hits: {stream_stats['hits']} | "
+                   f"resolved: {stream_stats['resolved']}")
+
+        webhook_stats = get_webhook_transport().stats()
+        if webhook_stats:
+            with st.expander("📡 WEBHOOK LATENCY"):
+                st.dataframe(pd.DataFrame.from_dict(webhook_stats, orient="index"), use_container_width=True)
+
+        tti_samples = sorted(get_boot_metrics())
+        if tti_samples:
+            st.caption(f"⏱️ LOGIN GATE SERVER RENDER // p50: {tti_samples[len(tti_samples) // 2]:.0f} ms | "
+                       f"max: {tti_samples[-1]:.0f} ms | sessions: {len(tti_samples)}")
+
         # 2. INITIALIZE TABS
         tab1, tab2, tab3, tab4 = st.tabs(["👥 User Matrix", "💰 Revenue Sync", "📡 Lead Drop", "🔐 Identity Logs"])
 
@@ -2927,7 +5197,7 @@ elif page == "🛡️ Admin Console":
                         NEW_URL = get_void_secret("ADMIN_ACTIVATE_URL", "RESTRICTED")
                         
                         if NEW_URL != "RESTRICTED":
-                            response = requests.post(NEW_URL, json=payload, timeout=30)
+                            response = webhook_post(NEW_URL, "ROLE_UPGRADE", json=payload, timeout=30)
                             
                             if response.status_code == 200 and "SUCCESS" in response.text:
                                 st.success(f"⚔️ OMNI-SYNC COMPLETE: {target_mail} updated in Google Sheets.")
@@ -2960,7 +5230,7 @@ elif page == "🛡️ Admin Console":
                             LOG_API = get_void_secret("ADMIN_LOG_URL", "RESTRICTED")
                             
                             if LOG_API != "RESTRICTED":
-                                f_res = requests.post(LOG_API, json=f_payload, timeout=10)
+                                f_res = webhook_post(LOG_API, "PAYMENT_PENDING", json=f_payload, timeout=10)
                                 if f_res.status_code == 200:
                                     st.success("✅ TRANSMISSION SUCCESS: Verification request logged.")
                                     st.balloons()
@@ -3063,7 +5333,7 @@ elif page == "⚖️ Legal Archive":
 
                     try:
                         # We send the data "behind the scenes"
-                        response = requests.post(form_url, data=payload)
+                        response = webhook_post(form_url, "LEGAL_VAULT_FORM", data=payload)
                         
                         if response.status_code == 200:
                             st.success(f"**Recommendation Locked, {st.session_state.get('user_name', 'Director')}!**")
@@ -3106,35 +5376,46 @@ elif page == "🛰️ Media Uplink":
         
         if st.button("⚡ GENERATE CLEAN UPLINK", use_container_width=True):
             if uplink_url:
-                try:
-                    with st.spinner("🛰️ INTERCEPTING RAW STREAM VECTORS..."):
-                        ydl_opts = {
-                            'quiet': True,
-                            'no_warnings': True,
-                            'cookiefile': found_cookie_file if found_cookie_file else None,
-                            'format': 'best',
-                        }
-                        
-                        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                            info = ydl.extract_info(uplink_url, download=False)
-                            direct_url = info.get('url')
-                            title = info.get('title', 'Asset')
+                ydl_opts = {
+                    'quiet': True,
+                    'no_warnings': True,
+                    'cookiefile': found_cookie_file if found_cookie_file else None,
+                    'format': 'best',
+                    'socket_timeout': YTDLP_SOCKET_TIMEOUT,
+                }
 
-                        if direct_url:
-                            st.success(f"🎯 UPLINK SECURED: {title}")
-                            st.markdown(f"""
-                                <a href="{direct_url}" download="{title}.mp4" target="_blank" style="text-decoration: none;">
-                                    <div style="background-color: #00ff41; color: black; padding: 15px; text-align: center; border-radius: 10px; font-weight: bold; cursor: pointer;">
-                                        💾 CLICK TO SAVE ASSET TO DISK
-                                    </div>
-                                </a>
-                                <p style='font-size: 0.8em; color: gray; margin-top: 10px;'>Note: If the video opens in a new tab, right-click and 'Save Video As'.</p>
-                            """, unsafe_allow_html=True)
-                except Exception as e:
-                    st.error(f"UPLINK FAILED: {str(e)}")
+                def resolve_uplink(source_url):
+                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                        return ydl.extract_info(source_url, download=False)
+
+                # Resolved on the yt_dlp pool and reused until shortly before the
+                # signed URL expires; the fragment below polls instead of blocking
+                st.session_state.pop('uplink_result', None)
+                st.session_state.uplink_resolve = {
+                    "future": get_stream_url_cache().submit(uplink_url, resolve_uplink),
+                    "deadline": time.monotonic() + YTDLP_DEADLINE_SECONDS,
+                }
             else:
                 st.warning("Director, please provide a URL.")
 
+        if 'uplink_resolve' in st.session_state:
+            uplink_monitor()
+
+        uplink_result = st.session_state.get('uplink_result')
+        if uplink_result and uplink_result[0] == "error":
+            st.error(f"UPLINK FAILED: {uplink_result[1]}")
+        elif uplink_result:
+            direct_url, title = uplink_result[1].url, uplink_result[1].title
+            st.success(f"🎯 UPLINK SECURED: {title}")
+            st.markdown(f"""
+                <a href="{direct_url}" download="{title}.mp4" target="_blank" style="text-decoration: none;">
+                    <div style="background-color: #00ff41; color: black; padding: 15px; text-align: center; border-radius: 10px; font-weight: bold; cursor: pointer;">
+                        💾 CLICK TO SAVE ASSET TO DISK
+                    </div>
+                </a>
+                <p style='font-size: 0.8em; color: gray; margin-top: 10px;'>Note: If the video opens in a new tab, right-click and 'Save Video As'.</p>
+            """, unsafe_allow_html=True)
+
 elif page == "⚙️ Settings":
     draw_title("⚙️", "SYSTEM SETTINGS")
     st.markdown("---")
@@ -3201,6 +5482,7 @@ elif page == "⚙️ Settings":
     with col_a:
         if st.button("🔄 CLEAR SYSTEM CACHE", use_container_width=True):
             st.cache_data.clear()
+            get_sheet_cache().clear()
             st.success("Local Memory Wiped.")
     with col_b:
         if st.button("🔓 TERMINATE SESSION", use_container_width=True):
@@ -0,0 +1,112 @@
+"""
+VOID OS // COLD-START IMPORT BENCHMARK
+
+Replays the module-level imports of app.py under `python -X importtime`
+and fails when the cold-start import cost creeps back up, or when a
+page-scoped dependency is imported eagerly by app.py. Page-scoped means
+registered through lazy_import, named as a provider SDK "module" for the client
+registry (groq, openai), or listed in HEAVY_PAGE_MODULES. Modules that eager
+packages pull in themselves (urllib3 under requests, ...) are not app.py's doing
+and are ignored.
+
+Usage:
+    python bench_imports.py                 # default budget
+    python bench_imports.py --budget-ms 1800
+"""
+import argparse
+import ast
+import os
+import subprocess
+import sys
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+DEFAULT_BUDGET_MS = float(os.environ.get("VOID_IMPORT_BUDGET_MS", 2500))
+# Heavy modules that app.py imports inside page branches
+HEAVY_PAGE_MODULES = {"plotly"}
+
+
+def collect_imports(tree):
+    """Module-level import statements, their root modules, and the page-scoped module names."""
+    statements = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    eager = [ast.unparse(node) for node in statements]
+    eager_roots = {
+        (alias.name if isinstance(node, ast.Import) else node.module).split(".")[0]
+        for node in statements
+        for alias in node.names
+    }
+    lazy = set(HEAVY_PAGE_MODULES)
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "lazy_import"
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+        ):
+            lazy.add(node.args[0].value)
+        elif isinstance(node, ast.Dict):
+            for key, value in zip(node.keys, node.values):
+                if (
+                    isinstance(key, ast.Constant) and key.value == "module"
+                    and isinstance(value, ast.Constant) and isinstance(value.value, str)
+                ):
+                    lazy.add(value.value)
+    return eager, eager_roots, lazy
+
+
+def run_importtime(statements):
+    """Runs the statements in a cold interpreter and returns the importtime trace."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "\n".join(statements)],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else "import failed")
+    return proc.stderr
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start import budget check for app.py")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+
+    with open(APP_PATH, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    eager, eager_roots, lazy = collect_imports(tree)
+
+    try:
+        trace = run_importtime(eager)
+    except RuntimeError as e:
+        print(f"IMPORT BENCH ABORTED: {e}")
+        return 2
+
+    # Only app.py's own eager statements count as leaks, not their dependencies
+    leaked = eager_roots & {m.split(".")[0] for m in lazy}
+    total_us = 0
+    for line in trace.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        cumulative, name = int(fields[1]), fields[2]
+        module = name.strip()
+        # Only top-level rows (no indentation) contribute to the total
+        if name == " " + module:
+            total_us += cumulative
+
+    total_ms = total_us / 1000
+    print(f"COLD-START IMPORTS: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"PAGE-SCOPED MODULES: {', '.join(sorted(lazy)) or 'none'}")
+
+    failed = False
+    if leaked:
+        print(f"FAIL: page-scoped modules imported eagerly: {', '.join(sorted(leaked))}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"FAIL: cold-start import cost exceeded budget by {total_ms - args.budget_ms:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())